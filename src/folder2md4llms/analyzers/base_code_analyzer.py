@@ -2,9 +2,12 @@
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+_BRACE_RE = re.compile(r"[{}]")
+
 
 class BaseCodeAnalyzer(ABC):
     """Base class for code analyzers that extract structure from source code files."""
@@ -151,6 +154,50 @@ class BaseCodeAnalyzer(ABC):
         lines = text.split("\n")
         return "\n".join(indent + line if line.strip() else line for line in lines)
 
+    def _finditer_with_lines(
+        self, pattern: re.Pattern[str], content: str
+    ) -> Iterator[tuple[re.Match[str], int]]:
+        """Iterate over pattern matches together with their 1-based line numbers.
+
+        Matches arrive in order, so newlines are only counted between
+        consecutive matches rather than from the start for each one.
+
+        Args:
+            pattern: Compiled pattern to search with
+            content: Text to search
+
+        Yields:
+            Tuples of (match, line number of the match start)
+        """
+        line = 1
+        line_pos = 0
+        for match in pattern.finditer(content):
+            start_pos = match.start()
+            line += content.count("\n", line_pos, start_pos)
+            line_pos = start_pos
+            yield match, line
+
+    def _preceding_lines(self, content: str, end_pos: int, count: int) -> list[str]:
+        """Return the last ``count`` lines of ``content[:end_pos]``.
+
+        Equivalent to ``content[:end_pos].split("\n")[-count:]`` without
+        copying and splitting the whole prefix.
+
+        Args:
+            content: Text to look back through
+            end_pos: Position the lines end at
+            count: Maximum number of lines to return
+
+        Returns:
+            The trailing lines, the last one possibly partial
+        """
+        window_start = end_pos
+        for _ in range(count):
+            window_start = content.rfind("\n", 0, window_start)
+            if window_start < 0:
+                return content[:end_pos].split("\n")
+        return content[window_start + 1 : end_pos].split("\n")
+
     def _truncate_list(
         self, items: list[Any], max_items: int = 10, item_name: str = "items"
     ) -> list[Any]:
@@ -209,12 +256,38 @@ class RegexBasedAnalyzer(BaseCodeAnalyzer):
         self.class_pattern: re.Pattern | None = None
         self.import_pattern: re.Pattern | None = None
         self.comment_pattern: re.Pattern | None = None
+        # Brace pairs of the most recently scanned content
+        self._brace_pairs_content: str | None = None
+        self._brace_pairs: dict[int, int] = {}
 
     @abstractmethod
     def _compile_patterns(self) -> None:
         """Compile regex patterns for the specific language."""
         pass
 
+    def _find_matching_brace(self, content: str, start_pos: int) -> int | None:
+        """Find the matching closing brace for an opening brace.
+
+        All braces in the content are paired in a single pass the first time
+        it is queried, so looking up the body of every declaration costs O(1)
+        instead of rescanning from each opening brace.
+        """
+        if start_pos >= len(content) or content[start_pos] != "{":
+            return None
+
+        if self._brace_pairs_content is not content:
+            pairs: dict[int, int] = {}
+            open_positions: list[int] = []
+            for match in _BRACE_RE.finditer(content):
+                if match.group() == "{":
+                    open_positions.append(match.start())
+                elif open_positions:
+                    pairs[open_positions.pop()] = match.start()
+            self._brace_pairs = pairs
+            self._brace_pairs_content = content
+
+        return self._brace_pairs.get(start_pos)
+
     def analyze_file(self, file_path: Path) -> str | None:
         """Analyze a source code file and return condensed content."""
         try:
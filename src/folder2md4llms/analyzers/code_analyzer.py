@@ -5,6 +5,9 @@ import textwrap
 from pathlib import Path
 from typing import Any
 
+# Node types collected as imports while walking the module tree
+_IMPORT_NODES = (ast.Import, ast.ImportFrom)
+
 
 class PythonCodeAnalyzer:
     """Analyzer for Python code that extracts signatures, docstrings, and structure."""
@@ -88,7 +91,7 @@ class PythonCodeAnalyzer:
         # Process top-level imports
         imports = []
         for node in ast.walk(tree):
-            if isinstance(node, ast.Import | ast.ImportFrom):
+            if isinstance(node, _IMPORT_NODES):
                 imports.append(self._get_source_segment(lines, node))
 
         if imports:
@@ -6,6 +6,9 @@ from typing import Any
 
 from .base_code_analyzer import RegexBasedAnalyzer
 
+# Characters that matter when matching braces; a backslash takes the next one
+_BRACE_SCAN_RE = re.compile(r"\\.|[{}\"']", re.DOTALL)
+
 
 class JavaAnalyzer(RegexBasedAnalyzer):
     """Analyzer for Java source files."""
@@ -93,17 +96,16 @@ class JavaAnalyzer(RegexBasedAnalyzer):
         classes = []
 
         if self.class_pattern:
-            for match in self.class_pattern.finditer(content):
+            for match, line in self._finditer_with_lines(self.class_pattern, content):
                 class_type = match.group(1)  # class, interface, enum, record
                 class_name = match.group(2)
                 start_pos = match.start()
 
                 # Extract Javadoc if available
-                preceding_content = content[:start_pos]
-                javadoc = self._extract_preceding_javadoc(preceding_content)
+                javadoc = self._extract_preceding_javadoc(content, start_pos)
 
                 # Extract annotations
-                annotations = self._extract_preceding_annotations(preceding_content)
+                annotations = self._extract_preceding_annotations(content, start_pos)
 
                 # Find class body
                 class_start = match.end()
@@ -122,7 +124,7 @@ class JavaAnalyzer(RegexBasedAnalyzer):
                         "annotations": annotations,
                         "methods": methods,
                         "fields": fields,
-                        "line": content[:start_pos].count("\n") + 1,
+                        "line": line,
                     }
                 )
 
@@ -141,11 +143,10 @@ class JavaAnalyzer(RegexBasedAnalyzer):
 
                 # Extract preceding Javadoc
                 start_pos = match.start()
-                preceding_content = class_body[:start_pos]
-                javadoc = self._extract_preceding_javadoc(preceding_content)
+                javadoc = self._extract_preceding_javadoc(class_body, start_pos)
 
                 # Extract annotations
-                annotations = self._extract_preceding_annotations(preceding_content)
+                annotations = self._extract_preceding_annotations(class_body, start_pos)
 
                 methods.append(
                     {
@@ -172,8 +173,7 @@ class JavaAnalyzer(RegexBasedAnalyzer):
 
                 # Extract preceding annotations
                 start_pos = match.start()
-                preceding_content = class_body[:start_pos]
-                annotations = self._extract_preceding_annotations(preceding_content)
+                annotations = self._extract_preceding_annotations(class_body, start_pos)
 
                 fields.append(
                     {
@@ -186,19 +186,19 @@ class JavaAnalyzer(RegexBasedAnalyzer):
 
         return fields[:10]  # Limit fields shown
 
-    def _extract_preceding_javadoc(self, preceding_content: str) -> str | None:
+    def _extract_preceding_javadoc(self, content: str, end_pos: int) -> str | None:
         """Extract Javadoc comment that precedes the current position."""
         if not self.javadoc_pattern or not self._should_include_docstring():
             return None
 
         # Look for Javadoc in the last few lines before the current position
-        lines = preceding_content.split("\n")
+        lines = self._preceding_lines(content, end_pos, 15)
 
         # Work backwards to find Javadoc
         javadoc_lines: list[str] = []
         in_javadoc = False
 
-        for line in reversed(lines[-15:]):  # Check last 15 lines
+        for line in reversed(lines):  # Check last 15 lines
             line = line.strip()
             if line.endswith("*/"):
                 in_javadoc = True
@@ -222,7 +222,7 @@ class JavaAnalyzer(RegexBasedAnalyzer):
 
         return None
 
-    def _extract_preceding_annotations(self, preceding_content: str) -> list[str]:
+    def _extract_preceding_annotations(self, content: str, end_pos: int) -> list[str]:
         """Extract annotations that precede the current position."""
         annotations: list[str] = []
 
@@ -230,9 +230,9 @@ class JavaAnalyzer(RegexBasedAnalyzer):
             return annotations
 
         # Look for annotations in the last few lines
-        lines = preceding_content.split("\n")
+        lines = self._preceding_lines(content, end_pos, 10)
 
-        for line in reversed(lines[-10:]):  # Check last 10 lines
+        for line in reversed(lines):  # Check last 10 lines
             line = line.strip()
             if line.startswith("@"):
                 annotations.insert(0, line)
@@ -243,36 +243,37 @@ class JavaAnalyzer(RegexBasedAnalyzer):
         return annotations
 
     def _find_matching_brace(self, content: str, start_pos: int) -> int | None:
-        """Find the matching closing brace for an opening brace."""
+        """Find the matching closing brace, skipping string and char literals.
+
+        Literal state depends on where the scan begins, so unlike the shared
+        brace table this scans forward from the given opening brace.
+        """
         if start_pos >= len(content) or content[start_pos] != "{":
             return None
 
         brace_count = 1
-        pos = start_pos + 1
         in_string = False
         in_char = False
-        escape_next = False
-
-        while pos < len(content) and brace_count > 0:
-            char = content[pos]
 
-            if escape_next:
-                escape_next = False
-            elif char == "\\":
-                escape_next = True
-            elif char == '"' and not in_char:
+        # Jump straight between braces, quotes and escapes
+        for match in _BRACE_SCAN_RE.finditer(content, start_pos + 1):
+            char = match.group()
+            if char[0] == "\\":
+                # Escaped character, never a quote or brace
+                continue
+            if char == '"' and not in_char:
                 in_string = not in_string
             elif char == "'" and not in_string:
                 in_char = not in_char
             elif not in_string and not in_char:
                 if char == "{":
                     brace_count += 1
-                elif char == "}":
+                else:
                     brace_count -= 1
+                    if brace_count == 0:
+                        return match.start()
 
-            pos += 1
-
-        return pos - 1 if brace_count == 0 else None
+        return None
 
     def analyze_code(self, content: str, filename: str = "<string>") -> str | None:
         """Analyze Java code and return condensed version."""
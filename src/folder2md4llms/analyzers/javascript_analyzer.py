@@ -6,6 +6,9 @@ from typing import Any
 
 from .base_code_analyzer import RegexBasedAnalyzer
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_JSDOC_LINE_PREFIX_RE = re.compile(r"^\s*\*\s?")
+
 
 class JavaScriptAnalyzer(RegexBasedAnalyzer):
     """Analyzer for JavaScript and TypeScript files."""
@@ -28,6 +31,20 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
             re.MULTILINE,
         )
 
+        # Function definitions with indent, name, params and return type,
+        # kept separate so each form is listed in turn
+        self.function_definition_patterns = [
+            re.compile(pattern, re.MULTILINE)
+            for pattern in (
+                # Regular function declarations
+                r"(?:^|\n)(\s*)(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+))?\s*\{",
+                # Arrow functions
+                r"(?:^|\n)(\s*)(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\(([^)]*)\)(?:\s*:\s*([^=]+?))?\s*=>\s*\{",
+                # Method definitions in classes
+                r"(?:^|\n)(\s*)(?:async\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+))?\s*\{",
+            )
+        ]
+
         # Class patterns
         self.class_pattern = re.compile(
             r"(?:^|\n)\s*(?:export\s+)?(?:abstract\s+)?class\s+(\w+)(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?\s*\{",
@@ -77,7 +94,7 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
             for match in self.import_pattern.finditer(content):
                 import_line = match.group().strip()
                 # Clean up multiline imports
-                import_line = re.sub(r"\s+", " ", import_line)
+                import_line = _WHITESPACE_RE.sub(" ", import_line)
                 imports.append(import_line)
 
         return imports[:15]  # Limit to first 15 imports
@@ -87,17 +104,8 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
         functions = []
 
         # Find all function-like constructs
-        patterns = [
-            # Regular function declarations
-            r"(?:^|\n)(\s*)(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+))?\s*\{",
-            # Arrow functions
-            r"(?:^|\n)(\s*)(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\(([^)]*)\)(?:\s*:\s*([^=]+?))?\s*=>\s*\{",
-            # Method definitions in classes
-            r"(?:^|\n)(\s*)(?:async\s+)?(\w+)\s*\(([^)]*)\)(?:\s*:\s*([^{]+))?\s*\{",
-        ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, content, re.MULTILINE):
+        for pattern in self.function_definition_patterns:
+            for match, line in self._finditer_with_lines(pattern, content):
                 indent = match.group(1) if len(match.groups()) >= 1 else ""
                 name = match.group(2) if len(match.groups()) >= 2 else "anonymous"
                 params = match.group(3) if len(match.groups()) >= 3 else ""
@@ -105,8 +113,7 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
 
                 # Extract JSDoc if available
                 start_pos = match.start()
-                preceding_content = content[:start_pos]
-                jsdoc = self._extract_preceding_jsdoc(preceding_content)
+                jsdoc = self._extract_preceding_jsdoc(content, start_pos)
 
                 functions.append(
                     {
@@ -115,7 +122,7 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
                         "return_type": return_type.strip() if return_type else None,
                         "jsdoc": jsdoc,
                         "indent": len(indent),
-                        "line": content[:start_pos].count("\n") + 1,
+                        "line": line,
                     }
                 )
 
@@ -126,13 +133,12 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
         classes = []
 
         if self.class_pattern:
-            for match in self.class_pattern.finditer(content):
+            for match, line in self._finditer_with_lines(self.class_pattern, content):
                 class_name = match.group(1)
                 start_pos = match.start()
 
                 # Extract JSDoc if available
-                preceding_content = content[:start_pos]
-                jsdoc = self._extract_preceding_jsdoc(preceding_content)
+                jsdoc = self._extract_preceding_jsdoc(content, start_pos)
 
                 # Find class methods
                 class_start = match.end()
@@ -146,7 +152,7 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
                         "name": class_name,
                         "jsdoc": jsdoc,
                         "methods": methods,
-                        "line": content[:start_pos].count("\n") + 1,
+                        "line": line,
                     }
                 )
 
@@ -157,19 +163,20 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
         interfaces = []
 
         if hasattr(self, "interface_pattern") and self.interface_pattern:
-            for match in self.interface_pattern.finditer(content):
+            for match, line in self._finditer_with_lines(
+                self.interface_pattern, content
+            ):
                 interface_name = match.group(1)
                 start_pos = match.start()
 
                 # Extract JSDoc if available
-                preceding_content = content[:start_pos]
-                jsdoc = self._extract_preceding_jsdoc(preceding_content)
+                jsdoc = self._extract_preceding_jsdoc(content, start_pos)
 
                 interfaces.append(
                     {
                         "name": interface_name,
                         "jsdoc": jsdoc,
-                        "line": content[:start_pos].count("\n") + 1,
+                        "line": line,
                     }
                 )
 
@@ -180,13 +187,9 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
         types = []
 
         if hasattr(self, "type_pattern") and self.type_pattern:
-            for match in self.type_pattern.finditer(content):
+            for match, line in self._finditer_with_lines(self.type_pattern, content):
                 type_name = match.group(1)
-                start_pos = match.start()
-
-                types.append(
-                    {"name": type_name, "line": content[:start_pos].count("\n") + 1}
-                )
+                types.append({"name": type_name, "line": line})
 
         return types
 
@@ -217,19 +220,19 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
 
         return methods
 
-    def _extract_preceding_jsdoc(self, preceding_content: str) -> str | None:
+    def _extract_preceding_jsdoc(self, content: str, end_pos: int) -> str | None:
         """Extract JSDoc comment that precedes the current position."""
         if not self.jsdoc_pattern or not self._should_include_docstring():
             return None
 
         # Look for JSDoc in the last few lines before the current position
-        lines = preceding_content.split("\n")
+        lines = self._preceding_lines(content, end_pos, 10)
 
         # Work backwards to find JSDoc
         jsdoc_lines: list[str] = []
         in_jsdoc = False
 
-        for line in reversed(lines[-10:]):  # Check last 10 lines
+        for line in reversed(lines):  # Check last 10 lines
             line = line.strip()
             if line.endswith("*/"):
                 in_jsdoc = True
@@ -246,31 +249,13 @@ class JavaScriptAnalyzer(RegexBasedAnalyzer):
             # Clean up JSDoc
             cleaned = []
             for line in jsdoc_lines[1:-1]:  # Skip /** and */
-                line = re.sub(r"^\s*\*\s?", "", line)
+                line = _JSDOC_LINE_PREFIX_RE.sub("", line)
                 if line.strip():
                     cleaned.append(line)
             return "\n".join(cleaned) if cleaned else None
 
         return None
 
-    def _find_matching_brace(self, content: str, start_pos: int) -> int | None:
-        """Find the matching closing brace for an opening brace."""
-        if start_pos >= len(content) or content[start_pos] != "{":
-            return None
-
-        brace_count = 1
-        pos = start_pos + 1
-
-        while pos < len(content) and brace_count > 0:
-            char = content[pos]
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-            pos += 1
-
-        return pos - 1 if brace_count == 0 else None
-
     def analyze_code(self, content: str, filename: str = "<string>") -> str | None:
         """Analyze JavaScript/TypeScript code and return condensed version."""
         try:
@@ -7,6 +7,20 @@ from enum import Enum
 from pathlib import Path
 
 from ..utils.file_utils import get_language_from_extension
+from ..utils.ignore_patterns import IgnorePatterns
+
+# Node types inspected when resolving a module's import dependencies
+_IMPORT_NODES = (ast.Import, ast.ImportFrom)
+
+
+def _may_define_python_symbols(content: str) -> bool:
+    """Cheap check for whether Python source can define functions or classes.
+
+    Function and class nodes need the literal ``def`` or ``class`` keyword,
+    so source without either (data modules, generated literals) can skip
+    ``ast.parse`` when only those nodes are of interest.
+    """
+    return "def" in content or "class" in content
 
 
 class PriorityLevel(Enum):
@@ -22,8 +36,18 @@ class PriorityLevel(Enum):
 class ContentPriorityAnalyzer:
     """Analyzes content to determine priority levels for smart condensing."""
 
-    def __init__(self):
-        """Initialize the priority analyzer."""
+    def __init__(self, ignore_patterns: IgnorePatterns | None = None):
+        """Initialize the priority analyzer.
+
+        Args:
+            ignore_patterns: Patterns that repository walks skip; defaults to
+                the built-in VCS, dependency and build patterns
+        """
+        self.ignore_patterns = (
+            ignore_patterns if ignore_patterns is not None else IgnorePatterns()
+        )
+        self._framework_cache: dict[Path, str | None] = {}
+
         # Enhanced file patterns for different priority levels
         self.critical_file_patterns = {
             r"main\.py$",
@@ -219,6 +243,19 @@ class ContentPriorityAnalyzer:
             },
         }
 
+    def start_run(self, ignore_patterns: IgnorePatterns | None = None) -> None:
+        """Prepare for a new repository run.
+
+        Cached framework lookups are dropped so a long-lived analyzer sees
+        the tree as it is now.
+
+        Args:
+            ignore_patterns: Patterns for this run; keeps the current ones if None
+        """
+        if ignore_patterns is not None:
+            self.ignore_patterns = ignore_patterns
+        self._framework_cache.clear()
+
     def analyze_file_priority(
         self, file_path: Path, content: str | None = None
     ) -> PriorityLevel:
@@ -347,7 +384,16 @@ class ContentPriorityAnalyzer:
         import_counts: dict[Path, int] = defaultdict(int)
 
         # Build reverse import graph - who imports what
-        for file_path in repo_path.rglob("*.py"):
+        python_files = (
+            directory / filename
+            for directory, _, filenames in self.ignore_patterns.walk(repo_path)
+            for filename in filenames
+            if filename.endswith(".py")
+            and not self.ignore_patterns.should_ignore(
+                directory / filename, repo_path, is_directory=False
+            )
+        )
+        for file_path in python_files:
             try:
                 # Try UTF-8 first with error handling for surrogates
                 try:
@@ -430,6 +476,10 @@ class ContentPriorityAnalyzer:
         if self._matches_patterns(content, self.configuration_patterns):
             return PriorityLevel.HIGH
 
+        # Only function and class nodes carry priority hints
+        if not _may_define_python_symbols(content):
+            return PriorityLevel.MEDIUM
+
         try:
             tree = ast.parse(content)
 
@@ -565,7 +615,7 @@ class ContentPriorityAnalyzer:
         try:
             tree = ast.parse(content)
             for node in ast.walk(tree):
-                if isinstance(node, ast.Import | ast.ImportFrom):
+                if isinstance(node, _IMPORT_NODES):
                     # Try to resolve import to actual file
                     import_path = self._resolve_import_path(node, file_path, repo_path)
                     if import_path:
@@ -604,6 +654,10 @@ class ContentPriorityAnalyzer:
 
     def detect_framework(self, repo_path: Path) -> str | None:
         """Detect the primary framework used in the repository."""
+        # Every file in a directory asks about the same tree
+        if repo_path in self._framework_cache:
+            return self._framework_cache[repo_path]
+
         # Skip framework detection if path doesn't exist or isn't accessible
         if not repo_path.exists() or not repo_path.is_dir():
             return None
@@ -618,16 +672,36 @@ class ContentPriorityAnalyzer:
                 "nextjs": ["next.config.js", "next.config.mjs"],
             }
 
-            for framework, files in indicators.items():
-                for indicator in files:
-                    if list(repo_path.rglob(indicator)):
-                        return framework
+            # Collect entry names in one pruned walk instead of one
+            # recursive glob per indicator
+            names: set[str] = set()
+            for directory, dirnames, filenames in self.ignore_patterns.walk(repo_path):
+                names.update(dirnames)
+                names.update(
+                    filename
+                    for filename in filenames
+                    if not self.ignore_patterns.should_ignore(
+                        directory / filename, repo_path, is_directory=False
+                    )
+                )
         except (OSError, PermissionError):
             # Return None if directory is inaccessible
             return None
 
-        # Check package files for dependencies
-        return self._check_dependencies(repo_path)
+        framework = next(
+            (
+                framework
+                for framework, files in indicators.items()
+                if any(indicator in names for indicator in files)
+            ),
+            None,
+        )
+        if framework is None:
+            # Check package files for dependencies
+            framework = self._check_dependencies(repo_path)
+
+        self._framework_cache[repo_path] = framework
+        return framework
 
     def _check_dependencies(self, repo_path: Path) -> str | None:
         """Check package files for framework dependencies."""
@@ -740,7 +814,7 @@ class ContentPriorityAnalyzer:
         complexity_score = 0.0
 
         # Check for complex patterns
-        if file_path.suffix == ".py":
+        if file_path.suffix == ".py" and _may_define_python_symbols(content):
             try:
                 tree = ast.parse(content)
                 # Count classes, functions, decorators
@@ -757,11 +831,11 @@ class ContentPriorityAnalyzer:
             except SyntaxError:
                 pass
 
-        lines = content.split("\n")
         # Adjust for file size - larger files might be more important
-        if len(lines) > 500:
+        line_count = content.count("\n") + 1
+        if line_count > 500:
             complexity_score *= 1.2
-        elif len(lines) < 50:
+        elif line_count < 50:
             complexity_score *= 0.8
 
         return min(complexity_score / 10.0, 1.0)  # Normalize to 0-1
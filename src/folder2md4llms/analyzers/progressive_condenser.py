@@ -1,22 +1,165 @@
 """Progressive condenser for adaptive code condensing based on available token budget."""
 
 import ast
+import json
+import os
 import re
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from itertools import islice
 from pathlib import Path
 
+import yaml
+
 from ..utils.token_utils import estimate_tokens_from_text
 from .priority_analyzer import PriorityLevel
 
-
-class CondensingLevel:
-    """Defines different levels of code condensing."""
-
-    NONE = "none"  # Full content preservation
-    LIGHT = "light"  # Remove comments, empty lines
-    MODERATE = "moderate"  # Signatures + docstrings
-    HEAVY = "heavy"  # Signatures only
-    MAXIMUM = "maximum"  # Minimal structure only
+# Precompiled patterns for JavaScript/TypeScript and Java condensing
+_LINE_COMMENT_RE = re.compile(r"//.*$", re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_JS_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+_JS_FUNCTION_RE = re.compile(r"(?:export\s+)?(?:async\s+)?function\s+\w+\([^)]*\)")
+_JS_CLASS_RE = re.compile(r"(?:export\s+)?class\s+\w+(?:\s+extends\s+\w+)?")
+_JS_EXPORT_RE = re.compile(
+    r"export\s+(?:default\s+)?(?:const|let|var|function|class)\s+\w+"
+)
+_JS_EXPORT_LINE_RE = re.compile(r"export\s+.*")
+# Every export/function/class match starts at one of these keywords
+_JS_DECL_START_RE = re.compile(r"(?=export|async|function|class)")
+_JAVA_PACKAGE_RE = re.compile(r"package\s+[\w.]+;")
+_JAVA_IMPORT_RE = re.compile(r"import\s+[\w.]+;")
+_JAVA_CLASS_RE = re.compile(
+    r"(?:public\s+)?class\s+\w+(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?"
+)
+_JAVA_CLASS_NAME_RE = re.compile(r"class\s+\w+")
+_JAVA_METHOD_RE = re.compile(
+    r"(?:public|private|protected)?\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\([^)]*\)"
+)
+_JAVA_PUBLIC_CLASS_RE = re.compile(
+    r"public\s+class\s+\w+(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?"
+)
+_JAVA_PUBLIC_METHOD_RE = re.compile(
+    r"public\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\([^)]*\)"
+)
+
+# Light Python condensing, applied to content prefixed with a newline so that
+# every line starts with "\n": standalone comments (except "#0".."#9" markers)
+# are dropped, then each run of blank lines is collapsed to its first line
+_PY_COMMENT_LINE_RE = re.compile(r"\n[^\S\n]*#(?![0-9])[^\n]*")
+_PY_BLANK_RUN_RE = re.compile(r"(\n[^\S\n]*+)(?:\n[^\S\n]*+)+(?=\n|$)")
+_BLANK_OR_COMMENT_LINE_RE = re.compile(r"\n[^\S\n]*+(?:#[^\n]*)?(?=\n|\Z)")
+
+# AST node types treated as imports and as definitions when condensing
+# Python modules; tuples avoid building a union type on every isinstance
+_IMPORT_NODES = (ast.Import, ast.ImportFrom)
+_DEFINITION_NODES = (ast.ClassDef, ast.FunctionDef)
+
+# Method names and imports kept by the moderate and heavy Python levels
+_IMPORTANT_METHODS = frozenset(
+    {"__init__", "__call__", "__enter__", "__exit__", "main", "run", "execute"}
+)
+_HEAVY_KEEP_METHODS = frozenset({"__init__", "__call__", "main"})
+_ESSENTIAL_IMPORT_KEYWORDS = ("from __future__", "import os", "import sys")
+
+# Comments kept by semantic light condensing, and the blank runs it collapses
+_KEEP_COMMENT_KEYWORDS = ("todo", "fixme", "hack", "note", "important", "warning")
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+
+# libyaml-backed loader when PyYAML was built with it, else pure Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed module trees kept per condenser; oldest entries are evicted first
+_AST_CACHE_SIZE = 128
+
+# Smallest batch worth spreading over worker processes
+_MIN_PARALLEL_ITEMS = 8
+
+
+def _scan_js_declarations(content: str) -> tuple[list[str], list[str], list[str]]:
+    """Collect JS/TS exports, functions and classes in a single scan.
+
+    Candidate start positions are found in one pass; each declaration pattern
+    is then only tried at those positions. Results are identical to running
+    ``findall`` separately for each pattern, without rereading the whole text
+    once per pattern.
+
+    Returns:
+        Tuple of (exports, functions, classes) match lists
+    """
+    exports: list[str] = []
+    functions: list[str] = []
+    classes: list[str] = []
+    scans = (
+        (_JS_EXPORT_RE, exports),
+        (_JS_FUNCTION_RE, functions),
+        (_JS_CLASS_RE, classes),
+    )
+    # Matches of one pattern never overlap, mirroring findall semantics
+    next_pos = [0, 0, 0]
+
+    for candidate in _JS_DECL_START_RE.finditer(content):
+        pos = candidate.start()
+        for index, (pattern, found) in enumerate(scans):
+            if pos < next_pos[index]:
+                continue
+            match = pattern.match(content, pos)
+            if match:
+                found.append(match.group())
+                next_pos[index] = match.end()
+
+    return exports, functions, classes
+
+
+def _signature_parts(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> list[ast.AST]:
+    """Return the AST nodes that make up a function header after its name."""
+    args = node.args
+    parts: list[ast.AST] = [
+        *args.posonlyargs,
+        *args.args,
+        *args.kwonlyargs,
+        *args.defaults,
+        *(default for default in args.kw_defaults if default is not None),
+    ]
+    if args.vararg:
+        parts.append(args.vararg)
+    if args.kwarg:
+        parts.append(args.kwarg)
+    if node.returns:
+        parts.append(node.returns)
+    return parts
+
+
+class CondensingLevel(IntEnum):
+    """Defines different levels of code condensing.
+
+    Levels are ordered from least to most aggressive, so moving between them
+    is integer arithmetic. They render as their lowercase name (e.g. "light").
+    """
+
+    NONE = 0  # Full content preservation
+    LIGHT = 1  # Remove comments, empty lines
+    MODERATE = 2  # Signatures + docstrings
+    HEAVY = 3  # Signatures only
+    MAXIMUM = 4  # Minimal structure only
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    @classmethod
+    def from_value(cls, value: "CondensingLevel | str") -> "CondensingLevel | None":
+        """Resolve a level or its lowercase name (e.g. "heavy"), else None."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
 
 class PythonCodeAnalyzer:
@@ -83,6 +226,15 @@ class ProgressiveCondenser:
         # Enhanced pattern detection for better condensing
         self.python_analyzer = PythonCodeAnalyzer()
 
+        # Parsed trees keyed by source, shared by every condensing pass
+        self._ast_cache: dict[str, ast.Module] = {}
+
+    def __getstate__(self) -> dict:
+        """Pickle without the parsed-tree cache, e.g. when sent to workers."""
+        state = self.__dict__.copy()
+        state["_ast_cache"] = {}
+        return state
+
     def condense_with_budget(
         self,
         content: str,
@@ -103,6 +255,64 @@ class ProgressiveCondenser:
         Returns:
             Tuple of (condensed_content, condensing_info)
         """
+        condensed_content, condensing_info = self._condense_content(
+            content, file_path, available_tokens, priority, estimated_tokens
+        )
+        self._record_stats(condensing_info)
+        return condensed_content, condensing_info
+
+    def condense_batch(
+        self,
+        items: Sequence[tuple[str, Path, int, PriorityLevel]],
+        max_workers: int | None = None,
+    ) -> list[tuple[str, dict]]:
+        """Condense many files in parallel worker processes.
+
+        Condensing is CPU-bound (AST parsing, regex scans, tokenization), so
+        items are spread across processes rather than threads. Each worker
+        receives one copy of this condenser (without its parsed-tree cache)
+        and reuses it for all of its items. Batches smaller than
+        ``_MIN_PARALLEL_ITEMS`` are condensed in-process. Statistics from all
+        workers are merged into this condenser's stats.
+
+        Args:
+            items: Sequence of (content, file_path, available_tokens, priority)
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            List of (condensed_content, condensing_info) in the order of items
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        # Starting worker processes costs more than condensing a few files
+        if len(items) < _MIN_PARALLEL_ITEMS or max_workers <= 1:
+            return [self.condense_with_budget(*item) for item in items]
+
+        chunksize = max(1, len(items) // (max_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self,),
+        ) as executor:
+            results = list(
+                executor.map(_condense_batch_item, items, chunksize=chunksize)
+            )
+
+        for _, condensing_info in results:
+            self._record_stats(condensing_info)
+
+        return results
+
+    def _condense_content(
+        self,
+        content: str,
+        file_path: Path,
+        available_tokens: int,
+        priority: PriorityLevel,
+        estimated_tokens: int | None = None,
+    ) -> tuple[str, dict]:
+        """Condense content without touching stats (safe to run in workers)."""
         if not content.strip():
             return content, {"level": CondensingLevel.NONE, "tokens_saved": 0}
 
@@ -124,18 +334,14 @@ class ProgressiveCondenser:
             content, file_path, target_level, priority
         )
 
-        # Calculate actual tokens saved
-        final_tokens = estimate_tokens_from_text(condensed_content)
+        # Calculate actual tokens saved; content returned untouched (always
+        # the case at NONE) keeps its original count without re-estimating
+        if condensed_content is content:
+            final_tokens = estimated_tokens
+        else:
+            final_tokens = estimate_tokens_from_text(condensed_content)
         tokens_saved = estimated_tokens - final_tokens
 
-        # Update stats
-        self.stats["files_processed"] += 1  # type: ignore[operator]
-        self.stats["tokens_saved"] += tokens_saved  # type: ignore[operator]
-        levels_used = self.stats["condensing_levels_used"]
-        if isinstance(levels_used, dict):
-            level_count = levels_used.get(target_level, 0)
-            levels_used[target_level] = level_count + 1
-
         condensing_info = {
             "level": target_level,
             "original_tokens": estimated_tokens,
@@ -149,6 +355,20 @@ class ProgressiveCondenser:
 
         return condensed_content, condensing_info
 
+    def _record_stats(self, condensing_info: dict) -> None:
+        """Add one condensing result to the running statistics."""
+        # Empty content short-circuits without an original token count
+        if "original_tokens" not in condensing_info:
+            return
+
+        target_level = condensing_info["level"]
+        self.stats["files_processed"] += 1  # type: ignore[operator]
+        self.stats["tokens_saved"] += condensing_info["tokens_saved"]  # type: ignore[operator]
+        levels_used = self.stats["condensing_levels_used"]
+        if isinstance(levels_used, dict):
+            level_count = levels_used.get(target_level, 0)
+            levels_used[target_level] = level_count + 1
+
     def condense_function_selectively(
         self,
         function_content: str,
@@ -167,6 +387,11 @@ class ProgressiveCondenser:
         Returns:
             Condensed function content
         """
+        # Estimates never exceed one token per character, so short content
+        # that fits character-for-character needs no tokenization at all
+        if len(function_content) <= available_tokens:
+            return function_content
+
         estimated_tokens = estimate_tokens_from_text(function_content)
 
         if estimated_tokens <= available_tokens:
@@ -184,10 +409,10 @@ class ProgressiveCondenser:
     def adjust_condensing_level(
         self,
         current_content: str,
-        current_level: str,
+        current_level: CondensingLevel | str,
         token_budget_used: int,
         total_budget: int,
-    ) -> str:
+    ) -> CondensingLevel | str:
         """Dynamically adjust condensing level based on budget usage.
 
         Args:
@@ -218,6 +443,10 @@ class ProgressiveCondenser:
         """
         return self.stats.copy()
 
+    def clear_ast_cache(self) -> None:
+        """Drop cached syntax trees, e.g. between repository runs."""
+        self._ast_cache.clear()
+
     def generate_smart_statistics(self, processing_results: dict) -> dict:
         """Generate intelligent statistics about the processing."""
         stats = {
@@ -271,7 +500,7 @@ class ProgressiveCondenser:
 
         if file_extension == ".py":
             try:
-                tree = ast.parse(content)
+                tree = self._parse_python(content)
                 # Extract function names from AST
                 function_names = []
                 for node in ast.walk(tree):
@@ -308,7 +537,7 @@ class ProgressiveCondenser:
 
     def _determine_condensing_level(
         self, estimated_tokens: int, available_tokens: int, priority: PriorityLevel
-    ) -> str:
+    ) -> CondensingLevel:
         """Determine the appropriate condensing level."""
         if available_tokens >= estimated_tokens:
             return CondensingLevel.NONE
@@ -349,7 +578,11 @@ class ProgressiveCondenser:
                 return CondensingLevel.MAXIMUM
 
     def _apply_condensing(
-        self, content: str, file_path: Path, level: str, priority: PriorityLevel
+        self,
+        content: str,
+        file_path: Path,
+        level: CondensingLevel,
+        priority: PriorityLevel,
     ) -> str:
         """Apply the specified condensing level to content."""
         if level == CondensingLevel.NONE:
@@ -359,7 +592,11 @@ class ProgressiveCondenser:
         return self._apply_semantic_condensing(content, level, file_path, priority)
 
     def _apply_semantic_condensing(
-        self, content: str, level: str, file_path: Path, priority: PriorityLevel
+        self,
+        content: str,
+        level: CondensingLevel,
+        file_path: Path,
+        priority: PriorityLevel,
     ) -> str:
         """Apply semantic-aware condensing that preserves logical units."""
         suffix = file_path.suffix.lower()
@@ -401,13 +638,12 @@ class ProgressiveCondenser:
 
         for line in lines:
             stripped = line.strip()
-            # Keep docstrings and important comments
-            if stripped.startswith("#") and not any(
-                keyword in stripped.lower()
-                for keyword in ["todo", "fixme", "hack", "note", "important", "warning"]
-            ):
-                # Skip obvious comments
-                continue
+            # Keep docstrings and important comments; lowercase only comments
+            if stripped.startswith("#"):
+                lowered = stripped.lower()
+                if not any(keyword in lowered for keyword in _KEEP_COMMENT_KEYWORDS):
+                    # Skip obvious comments
+                    continue
             result.append(line)
 
         return "\n".join(result)
@@ -415,7 +651,7 @@ class ProgressiveCondenser:
     def _normalize_whitespace(self, content: str) -> str:
         """Normalize excessive whitespace."""
         # Remove multiple consecutive empty lines
-        content = re.sub(r"\n\s*\n\s*\n+", "\n\n", content)
+        content = _EXCESS_BLANK_LINES_RE.sub("\n\n", content)
         # Remove trailing whitespace
         lines = [line.rstrip() for line in content.split("\n")]
         return "\n".join(lines)
@@ -423,14 +659,15 @@ class ProgressiveCondenser:
     def _preserve_api_signatures(self, content: str) -> str:
         """Preserve public API signatures while condensing implementation."""
         try:
-            tree = ast.parse(content)
+            tree = self._parse_python(content)
             preserved = []
+            lines = content.split("\n")
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
                     if not node.name.startswith("_"):  # Public method
                         # Preserve signature and docstring
-                        sig_lines = self._extract_signature_and_docs(content, node)
+                        sig_lines = self._extract_signature_and_docs(lines, node)
                         preserved.extend(sig_lines)
 
             return "\n".join(preserved)
@@ -438,21 +675,14 @@ class ProgressiveCondenser:
             return content
 
     def _extract_signature_and_docs(
-        self, content: str, node: ast.FunctionDef
+        self, lines: list[str], node: ast.FunctionDef
     ) -> list[str]:
         """Extract function signature and docstring."""
-        lines = content.split("\n")
         result = []
 
         if hasattr(node, "lineno"):
-            start_line = node.lineno - 1
             # Add function signature
-            i = start_line
-            while i < len(lines) and ":" not in lines[i]:
-                result.append(lines[i])
-                i += 1
-            if i < len(lines):
-                result.append(lines[i])  # Line with colon
+            result.extend(self._get_signature_lines(node, lines))
 
             # Add docstring if present
             docstring = ast.get_docstring(node)
@@ -479,7 +709,7 @@ class ProgressiveCondenser:
     def _extract_python_public_api(self, content: str) -> str:
         """Extract Python public API."""
         try:
-            tree = ast.parse(content)
+            tree = self._parse_python(content)
             result = []
 
             for node in tree.body:
@@ -507,13 +737,7 @@ class ProgressiveCondenser:
     def _extract_js_public_api(self, content: str) -> str:
         """Extract JavaScript/TypeScript public API."""
         # Extract exports and public functions
-        exports = re.findall(
-            r"export\s+(?:default\s+)?(?:function|class|const|let|var)\s+\w+", content
-        )
-        functions = re.findall(
-            r"(?:export\s+)?(?:async\s+)?function\s+\w+\([^)]*\)", content
-        )
-        classes = re.findall(r"(?:export\s+)?class\s+\w+(?:\s+extends\s+\w+)?", content)
+        exports, functions, classes = _scan_js_declarations(content)
 
         result = []
         if exports:
@@ -528,13 +752,8 @@ class ProgressiveCondenser:
     def _extract_java_public_api(self, content: str) -> str:
         """Extract Java public API."""
         # Extract public class and method signatures
-        public_classes = re.findall(
-            r"public\s+class\s+\w+(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?",
-            content,
-        )
-        public_methods = re.findall(
-            r"public\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\([^)]*\)", content
-        )
+        public_classes = _JAVA_PUBLIC_CLASS_RE.findall(content)
+        public_methods = _JAVA_PUBLIC_METHOD_RE.findall(content)
 
         result = []
         if public_classes:
@@ -548,8 +767,8 @@ class ProgressiveCondenser:
         """Maximum condensing for any file type."""
         if file_type == ".py":
             try:
-                tree = ast.parse(content)
-                return self._maximum_condense_python(content, tree)
+                tree = self._parse_python(content)
+                return self._maximum_condense_python(tree)
             except SyntaxError:
                 return self._condense_generic_content(content, CondensingLevel.MAXIMUM)
         elif file_type in [".js", ".ts", ".jsx", ".tsx"]:
@@ -563,12 +782,22 @@ class ProgressiveCondenser:
         else:
             return self._condense_generic_content(content, CondensingLevel.MAXIMUM)
 
+    def _parse_python(self, content: str) -> ast.Module:
+        """Parse Python source, reusing the tree from an earlier pass."""
+        tree = self._ast_cache.get(content)
+        if tree is None:
+            tree = ast.parse(content)
+            if len(self._ast_cache) >= _AST_CACHE_SIZE:
+                del self._ast_cache[next(iter(self._ast_cache))]
+            self._ast_cache[content] = tree
+        return tree
+
     def _condense_python_content(
-        self, content: str, level: str, priority: PriorityLevel
+        self, content: str, level: CondensingLevel, priority: PriorityLevel
     ) -> str:
         """Condense Python content based on the specified level."""
         try:
-            tree = ast.parse(content)
+            tree = self._parse_python(content)
 
             # Use enhanced analysis for better condensing decisions
             # hierarchy = self.python_analyzer.extract_class_hierarchy(tree)
@@ -576,12 +805,15 @@ class ProgressiveCondenser:
 
             if level == CondensingLevel.LIGHT:
                 return self._light_condense_python(content, tree)
-            elif level == CondensingLevel.MODERATE:
-                return self._moderate_condense_python(content, tree, priority)
-            elif level == CondensingLevel.HEAVY:
-                return self._heavy_condense_python(content, tree)
             elif level == CondensingLevel.MAXIMUM:
-                return self._maximum_condense_python(content, tree)
+                return self._maximum_condense_python(tree)
+
+            # Signature-based levels slice source lines; split them only once
+            lines = content.split("\n")
+            if level == CondensingLevel.MODERATE:
+                return self._moderate_condense_python(lines, tree, priority)
+            elif level == CondensingLevel.HEAVY:
+                return self._heavy_condense_python(lines, tree)
 
         except SyntaxError:
             # If parsing fails, fall back to generic condensing
@@ -591,33 +823,17 @@ class ProgressiveCondenser:
 
     def _light_condense_python(self, content: str, tree: ast.AST) -> str:
         """Light condensing: remove comments and excessive whitespace."""
-        lines = content.split("\n")
-        condensed_lines: list[str] = []
-
-        for line in lines:
-            stripped = line.strip()
-            # Skip standalone comments but keep inline comments
-            if stripped.startswith("#") and not any(
-                stripped.startswith(f"#{i}") for i in range(10)
-            ):
-                continue
-            # Skip empty lines between functions/classes
-            if (
-                not stripped
-                and len(condensed_lines) > 0
-                and not condensed_lines[-1].strip()
-            ):
-                continue
-            condensed_lines.append(line)
-
-        return "\n".join(condensed_lines)
+        # Skip standalone comments but keep inline comments
+        condensed = _PY_COMMENT_LINE_RE.sub("", "\n" + content)
+        # Skip empty lines between functions/classes
+        condensed = _PY_BLANK_RUN_RE.sub(r"\1", condensed)
+        return condensed[1:]
 
     def _moderate_condense_python(
-        self, content: str, tree: ast.AST, priority: PriorityLevel
+        self, lines: list[str], tree: ast.AST, priority: PriorityLevel
     ) -> str:
         """Moderate condensing: preserve signatures and docstrings."""
         result = []
-        lines = content.split("\n")
 
         # Get module docstring
         module_docstring = None
@@ -630,74 +846,82 @@ class ProgressiveCondenser:
             result.append(f'"""{module_docstring}"""')
             result.append("")
 
-        # Process imports (keep first 10, summarize rest)
-        imports = []
-        if hasattr(tree, "body"):
-            for node in tree.body:
-                if isinstance(node, ast.Import | ast.ImportFrom):
+        # Classify top-level nodes in a single pass over the module body;
+        # imports past the first 10 are only counted for the summary
+        imports: list[str] = []
+        import_count = 0
+        definitions: list[ast.ClassDef | ast.FunctionDef] = []
+        for node in getattr(tree, "body", ()):
+            if isinstance(node, _IMPORT_NODES):
+                import_count += 1
+                if import_count <= 10:
                     imports.append(self._get_source_segment(lines, node))
+            elif isinstance(node, _DEFINITION_NODES):
+                definitions.append(node)
 
+        # Imports first (keep first 10, summarize rest)
         if imports:
-            result.extend(imports[:10])
-            if len(imports) > 10:
-                result.append(f"# ... and {len(imports) - 10} more imports")
+            result.extend(imports)
+            if import_count > 10:
+                result.append(f"# ... and {import_count - 10} more imports")
             result.append("")
 
-        # Process classes and functions
-        if hasattr(tree, "body"):
-            for node in tree.body:
-                if isinstance(node, ast.ClassDef):
-                    result.extend(self._condense_python_class(node, lines, priority))
-                    result.append("")
-                elif isinstance(node, ast.FunctionDef):
-                    result.extend(self._condense_python_function(node, lines, priority))
-                    result.append("")
+        # Then classes and functions in source order
+        for node in definitions:
+            if isinstance(node, ast.ClassDef):
+                self._condense_python_class(node, lines, priority, result)
+            else:
+                self._condense_python_function(node, lines, priority, result)
+            result.append("")
 
         return "\n".join(result)
 
-    def _heavy_condense_python(self, content: str, tree: ast.AST) -> str:
+    def _heavy_condense_python(self, lines: list[str], tree: ast.AST) -> str:
         """Heavy condensing: signatures only."""
         result = []
-        lines = content.split("\n")
 
-        # Essential imports only
-        essential_imports = []
-        if hasattr(tree, "body"):
-            for node in tree.body:
-                if isinstance(node, ast.Import | ast.ImportFrom):
-                    import_line = self._get_source_segment(lines, node)
-                    if any(
-                        keyword in import_line.lower()
-                        for keyword in ["from __future__", "import os", "import sys"]
-                    ):
-                        essential_imports.append(import_line)
+        # Classify top-level nodes in a single pass over the module body
+        essential_imports: list[str] = []
+        definitions: list[ast.ClassDef | ast.FunctionDef] = []
+        for node in getattr(tree, "body", ()):
+            if isinstance(node, _IMPORT_NODES):
+                # Essential imports only, at most 5 are shown
+                if len(essential_imports) >= 5:
+                    continue
+                import_line = self._get_source_segment(lines, node)
+                import_line_lower = import_line.lower()
+                if any(
+                    keyword in import_line_lower
+                    for keyword in _ESSENTIAL_IMPORT_KEYWORDS
+                ):
+                    essential_imports.append(import_line)
+            elif isinstance(node, _DEFINITION_NODES):
+                definitions.append(node)
 
         if essential_imports:
-            result.extend(essential_imports[:5])
+            result.extend(essential_imports)
             result.append("")
 
         # Class and function signatures only
-        if hasattr(tree, "body"):
-            for node in tree.body:
-                if isinstance(node, ast.ClassDef):
-                    result.append(self._get_class_signature(node, lines))
-                    # Include only critical methods
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef) and item.name in [
-                            "__init__",
-                            "__call__",
-                            "main",
-                        ]:
-                            result.append(
-                                "    " + self._get_function_signature(item, lines)
-                            )
-                    result.append("")
-                elif isinstance(node, ast.FunctionDef):
-                    result.append(self._get_function_signature(node, lines))
+        for node in definitions:
+            if isinstance(node, ast.ClassDef):
+                result.append(self._get_class_signature(node, lines))
+                # Include only critical methods
+                for item in node.body:
+                    if (
+                        isinstance(item, ast.FunctionDef)
+                        and item.name in _HEAVY_KEEP_METHODS
+                    ):
+                        result.append(
+                            "    " + self._get_function_signature(item, lines)
+                        )
+                result.append("")
+            else:
+                result.append(self._get_function_signature(node, lines))
 
         return "\n".join(result)
 
-    def _maximum_condense_python(self, content: str, tree: ast.AST) -> str:
+    def _maximum_condense_python(self, tree: ast.AST) -> str:
         """Maximum condensing: minimal structure overview."""
         result = []
 
@@ -732,28 +956,19 @@ class ProgressiveCondenser:
         return "\n".join(result)
 
     def _condense_javascript_content(
-        self, content: str, level: str, priority: PriorityLevel
+        self, content: str, level: CondensingLevel, priority: PriorityLevel
     ) -> str:
         """Condense JavaScript/TypeScript content."""
         if level == CondensingLevel.LIGHT:
             # Remove comments and extra whitespace
-            content = re.sub(r"//.*$", "", content, flags=re.MULTILINE)
-            content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
-            content = re.sub(r"\n\s*\n", "\n", content)
+            content = _LINE_COMMENT_RE.sub("", content)
+            content = _BLOCK_COMMENT_RE.sub("", content)
+            content = _JS_BLANK_LINES_RE.sub("\n", content)
             return content
 
         elif level in [CondensingLevel.MODERATE, CondensingLevel.HEAVY]:
             # Extract function signatures and exports
-            functions = re.findall(
-                r"(?:export\s+)?(?:async\s+)?function\s+\w+\([^)]*\)", content
-            )
-            classes = re.findall(
-                r"(?:export\s+)?class\s+\w+(?:\s+extends\s+\w+)?", content
-            )
-            exports = re.findall(
-                r"export\s+(?:default\s+)?(?:const|let|var|function|class)\s+\w+",
-                content,
-            )
+            exports, functions, classes = _scan_js_declarations(content)
 
             result = []
             if exports:
@@ -767,33 +982,27 @@ class ProgressiveCondenser:
 
         else:  # MAXIMUM
             # Just show exports and main structures
-            exports = re.findall(r"export\s+.*", content)
+            exports = _JS_EXPORT_LINE_RE.findall(content)
             return (
                 "\n".join(exports[:5]) if exports else "// JavaScript/TypeScript module"
             )
 
     def _condense_java_content(
-        self, content: str, level: str, priority: PriorityLevel
+        self, content: str, level: CondensingLevel, priority: PriorityLevel
     ) -> str:
         """Condense Java content."""
         if level == CondensingLevel.LIGHT:
             # Remove comments
-            content = re.sub(r"//.*$", "", content, flags=re.MULTILINE)
-            content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
+            content = _LINE_COMMENT_RE.sub("", content)
+            content = _BLOCK_COMMENT_RE.sub("", content)
             return content
 
         elif level in [CondensingLevel.MODERATE, CondensingLevel.HEAVY]:
             # Extract class signatures and public methods
-            package = re.search(r"package\s+[\w.]+;", content)
-            imports = re.findall(r"import\s+[\w.]+;", content)
-            classes = re.findall(
-                r"(?:public\s+)?class\s+\w+(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?",
-                content,
-            )
-            methods = re.findall(
-                r"(?:public|private|protected)?\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\([^)]*\)",
-                content,
-            )
+            package = _JAVA_PACKAGE_RE.search(content)
+            imports = _JAVA_IMPORT_RE.findall(content)
+            classes = _JAVA_CLASS_RE.findall(content)
+            methods = _JAVA_METHOD_RE.findall(content)
 
             result = []
             if package:
@@ -809,8 +1018,8 @@ class ProgressiveCondenser:
 
         else:  # MAXIMUM
             # Just package and class declarations
-            package = re.search(r"package\s+[\w.]+;", content)
-            classes = re.findall(r"class\s+\w+", content)
+            package = _JAVA_PACKAGE_RE.search(content)
+            classes = _JAVA_CLASS_NAME_RE.findall(content)
             result = []
             if package:
                 result.append(package.group())
@@ -818,90 +1027,107 @@ class ProgressiveCondenser:
                 result.extend([f"// {cls}" for cls in classes])
             return "\n".join(result)
 
-    def _condense_config_content(self, content: str, level: str) -> str:
+    def _condense_config_content(self, content: str, level: CondensingLevel) -> str:
         """Condense configuration file content."""
         if level == CondensingLevel.LIGHT:
             return content  # Config files are usually already concise
 
         # For config files, show structure overview
+        # Try to parse as JSON first
         try:
-            import json
-
-            import yaml
-
-            # Try to parse as JSON first
-            try:
-                data = json.loads(content)
-                return self._summarize_json_structure(data, level)
-            except json.JSONDecodeError:
-                pass
-
-            # Try YAML
-            try:
-                data = yaml.safe_load(content)
-                return self._summarize_yaml_structure(data, level)
-            except Exception:  # nosec B110
-                pass
+            data = json.loads(content)
+            return self._summarize_json_structure(data, level)
+        except json.JSONDecodeError:
+            pass
 
-        except ImportError:
+        # Try YAML
+        try:
+            data = yaml.load(content, Loader=_YAML_LOADER)  # nosec B506
+            return self._summarize_yaml_structure(data, level)
+        except Exception:  # nosec B110
             pass
 
         # Fall back to line-based summary
-        lines = content.split("\n")
-        if len(lines) <= 20:
+        if content.count("\n") < 20:
             return content
         else:
-            return "\n".join(lines[:10] + ["# ... truncated ..."] + lines[-5:])
+            return _keep_head_and_tail(content, 10, 5, "# ... truncated ...")
 
-    def _condense_generic_content(self, content: str, level: str) -> str:
+    def _condense_generic_content(self, content: str, level: CondensingLevel) -> str:
         """Generic condensing for unknown file types."""
-        lines = content.split("\n")
-
         if level == CondensingLevel.LIGHT:
-            # Remove empty lines and comments
-            return "\n".join(
-                line
-                for line in lines
-                if line.strip() and not line.strip().startswith("#")
-            )
+            # Remove empty lines and comments; each match takes the line
+            # together with its preceding newline, hence the sentinel
+            return _BLANK_OR_COMMENT_LINE_RE.sub("", "\n" + content)[1:]
 
         elif level == CondensingLevel.MODERATE:
             # Keep first 20 and last 10 lines
-            if len(lines) <= 30:
+            if content.count("\n") < 30:
                 return content
-            return "\n".join(lines[:20] + ["# ... content truncated ..."] + lines[-10:])
+            return _keep_head_and_tail(content, 20, 10, "# ... content truncated ...")
 
         else:
             # Heavy or maximum: just show first few lines
-            return "\n".join(lines[:10] + ["# ... heavily truncated ..."])
+            lines = content.split("\n", 10)[:10]
+            return "\n".join(lines + ["# ... heavily truncated ..."])
 
     # Helper methods for Python condensing
 
-    def _get_source_segment(self, lines: list[str], node: ast.AST) -> str:
-        """Get source code segment for an AST node."""
-        if hasattr(node, "lineno") and hasattr(node, "end_lineno"):
-            start = max(0, node.lineno - 1)
-            end = min(len(lines), node.end_lineno)
-            return "\n".join(lines[start:end])
-        return ""
+    def _get_source_segment(self, lines: list[str], node: ast.stmt) -> str:
+        """Get source code segment for an AST statement node."""
+        start = max(0, node.lineno - 1)
+        end = min(len(lines), node.end_lineno or len(lines))
+        return "\n".join(lines[start:end])
 
     def _get_function_signature(self, node: ast.FunctionDef, lines: list[str]) -> str:
         """Extract function signature from AST node."""
-        if hasattr(node, "lineno"):
-            line_no = node.lineno - 1
-            if line_no < len(lines):
-                # Find the complete function definition (might span multiple lines)
-                signature_lines = []
-                i = line_no
-                while i < len(lines):
-                    line = lines[i]
-                    signature_lines.append(line)
-                    if ":" in line:
-                        break
-                    i += 1
-                return "\n".join(signature_lines)
+        if hasattr(node, "lineno") and node.lineno - 1 < len(lines):
+            return "\n".join(self._get_signature_lines(node, lines))
         return f"def {node.name}(...):"
 
+    def _get_signature_lines(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, lines: list[str]
+    ) -> list[str]:
+        """Get the source lines of a function definition up to its body.
+
+        The signature may span several lines and contain colons in type
+        annotations, so its extent is taken from the AST: it ends on the line
+        before the first body statement (or its decorators), but never before
+        the line holding the last parameter or the return annotation, and it
+        includes the body's line when the body shares it with the header.
+        """
+        start = node.lineno - 1
+        if node.body:
+            first = node.body[0]
+            body_start = min(
+                [first.lineno]
+                + [d.lineno for d in getattr(first, "decorator_list", ())]
+            )
+            header_end = max(
+                (
+                    getattr(part, "end_lineno", None) or node.lineno
+                    for part in _signature_parts(node)
+                ),
+                default=node.lineno,
+            )
+            end = max(body_start - 1, min(header_end, first.lineno))
+            # A body sharing the closing line (``): return x``) keeps that line
+            if (
+                first.lineno <= len(lines)
+                and lines[first.lineno - 1].encode()[: first.col_offset].strip()
+            ):
+                end = max(end, first.lineno)
+        else:
+            end = node.end_lineno or node.lineno
+        signature_lines = lines[start : max(end, start + 1)]
+        # Drop blank and comment-only lines sitting between the def and its body
+        while len(signature_lines) > 1:
+            tail = signature_lines[-1].strip()
+            if tail and not tail.startswith("#"):
+                break
+            signature_lines.pop()
+        return signature_lines
+
     def _get_class_signature(self, node: ast.ClassDef, lines: list[str]) -> str:
         """Extract class signature from AST node."""
         if hasattr(node, "lineno"):
@@ -911,11 +1137,13 @@ class ProgressiveCondenser:
         return f"class {node.name}:"
 
     def _condense_python_class(
-        self, node: ast.ClassDef, lines: list[str], priority: PriorityLevel
-    ) -> list[str]:
-        """Condense a Python class preserving important methods."""
-        result = []
-
+        self,
+        node: ast.ClassDef,
+        lines: list[str],
+        priority: PriorityLevel,
+        result: list[str],
+    ) -> None:
+        """Condense a Python class preserving important methods into ``result``."""
         # Class signature
         result.append(self._get_class_signature(node, lines))
 
@@ -925,33 +1153,25 @@ class ProgressiveCondenser:
             result.append(f'    """{docstring}"""')
 
         # Important methods
-        important_methods = [
-            "__init__",
-            "__call__",
-            "__enter__",
-            "__exit__",
-            "main",
-            "run",
-            "execute",
-        ]
         for item in node.body:
             if isinstance(item, ast.FunctionDef):
-                if item.name in important_methods or priority == PriorityLevel.CRITICAL:
+                if (
+                    item.name in _IMPORTANT_METHODS
+                    or priority == PriorityLevel.CRITICAL
+                ):
                     method_sig = self._get_function_signature(item, lines)
                     # Indent method signature
-                    indented = "\n".join(
-                        "    " + line for line in method_sig.split("\n")
-                    )
-                    result.append(indented)
-
-        return result
+                    for line in method_sig.split("\n"):
+                        result.append("    " + line)
 
     def _condense_python_function(
-        self, node: ast.FunctionDef, lines: list[str], priority: PriorityLevel
-    ) -> list[str]:
-        """Condense a Python function preserving signature and docstring."""
-        result = []
-
+        self,
+        node: ast.FunctionDef,
+        lines: list[str],
+        priority: PriorityLevel,
+        result: list[str],
+    ) -> None:
+        """Condense a Python function preserving signature and docstring into ``result``."""
         # Function signature
         result.append(self._get_function_signature(node, lines))
 
@@ -960,21 +1180,19 @@ class ProgressiveCondenser:
         if docstring and priority in [PriorityLevel.CRITICAL, PriorityLevel.HIGH]:
             result.append(f'    """{docstring}"""')
 
-        return result
-
-    def _summarize_json_structure(self, data, level: str) -> str:
+    def _summarize_json_structure(self, data: object, level: CondensingLevel) -> str:
         """Summarize JSON structure."""
         if level == CondensingLevel.MODERATE:
             return self._describe_data_structure(data, max_depth=2)
         else:
             return self._describe_data_structure(data, max_depth=1)
 
-    def _summarize_yaml_structure(self, data, level: str) -> str:
+    def _summarize_yaml_structure(self, data: object, level: CondensingLevel) -> str:
         """Summarize YAML structure."""
         return self._summarize_json_structure(data, level)
 
     def _describe_data_structure(
-        self, data, max_depth: int, current_depth: int = 0
+        self, data: object, max_depth: int, current_depth: int = 0
     ) -> str:
         """Describe the structure of nested data."""
         if current_depth >= max_depth:
@@ -983,8 +1201,8 @@ class ProgressiveCondenser:
         if isinstance(data, dict):
             if not data:
                 return "{}"
-            items = []
-            for key, value in list(data.items())[:5]:  # Limit to first 5 keys
+            items: list[str] = []
+            for key, value in islice(data.items(), 5):  # Limit to first 5 keys
                 value_desc = self._describe_data_structure(
                     value, max_depth, current_depth + 1
                 )
@@ -1008,41 +1226,30 @@ class ProgressiveCondenser:
                 return f"[{first_desc}, ...] (length: {len(data)})"
 
         else:
+            data_repr = repr(data)
             return (
-                f"{type(data).__name__}({repr(data)[:20]}...)"
-                if len(repr(data)) > 20
-                else repr(data)
+                f"{type(data).__name__}({data_repr[:20]}...)"
+                if len(data_repr) > 20
+                else data_repr
             )
 
-    def _increase_condensing_level(self, current_level: str) -> str:
+    def _increase_condensing_level(
+        self, current_level: CondensingLevel | str
+    ) -> CondensingLevel:
         """Increase condensing aggressiveness."""
-        levels = [
-            CondensingLevel.NONE,
-            CondensingLevel.LIGHT,
-            CondensingLevel.MODERATE,
-            CondensingLevel.HEAVY,
-            CondensingLevel.MAXIMUM,
-        ]
-        try:
-            current_index = levels.index(current_level)
-            return levels[min(current_index + 1, len(levels) - 1)]
-        except ValueError:
+        level = CondensingLevel.from_value(current_level)
+        if level is None:
             return CondensingLevel.MODERATE
+        return CondensingLevel(min(level + 1, CondensingLevel.MAXIMUM))
 
-    def _decrease_condensing_level(self, current_level: str) -> str:
+    def _decrease_condensing_level(
+        self, current_level: CondensingLevel | str
+    ) -> CondensingLevel:
         """Decrease condensing aggressiveness."""
-        levels = [
-            CondensingLevel.NONE,
-            CondensingLevel.LIGHT,
-            CondensingLevel.MODERATE,
-            CondensingLevel.HEAVY,
-            CondensingLevel.MAXIMUM,
-        ]
-        try:
-            current_index = levels.index(current_level)
-            return levels[max(current_index - 1, 0)]
-        except ValueError:
+        level = CondensingLevel.from_value(current_level)
+        if level is None:
             return CondensingLevel.MODERATE
+        return CondensingLevel(max(level - 1, CondensingLevel.NONE))
 
     def _condense_function_preserve_structure(
         self, function_content: str, language: str
@@ -1104,10 +1311,11 @@ class ProgressiveCondenser:
             return "\n".join(result)
         else:
             # For other languages, just preserve first and last few lines
-            lines = function_content.split("\n")
-            if len(lines) <= 10:
+            if function_content.count("\n") < 10:
                 return function_content
-            return "\n".join(lines[:5] + ["    // ... implementation ..."] + lines[-2:])
+            return _keep_head_and_tail(
+                function_content, 5, 2, "    // ... implementation ..."
+            )
 
     def _condense_function_minimal(self, function_content: str, language: str) -> str:
         """Minimally condense function to just signature."""
@@ -1126,4 +1334,34 @@ class ProgressiveCondenser:
                 ):
                     return line + "\n    // ... implementation ..."
 
-        return function_content.split("\n")[0] + "\n    # ..."
+        return function_content.split("\n", 1)[0] + "\n    # ..."
+
+
+def _keep_head_and_tail(content: str, head: int, tail: int, marker: str) -> str:
+    """Join the first and last lines of content around a truncation marker.
+
+    Only the kept lines are split off, so large inputs never become a
+    full list of lines.
+    """
+    first = content.split("\n", head)[:head]
+    last = content.rsplit("\n", tail)[-tail:]
+    return "\n".join([*first, marker, *last])
+
+
+# Copy of the batching condenser, installed once per worker process
+_worker_condenser: ProgressiveCondenser | None = None
+
+
+def _init_batch_worker(condenser: ProgressiveCondenser) -> None:
+    """Keep the condenser sent by condense_batch for this worker's items."""
+    global _worker_condenser
+    _worker_condenser = condenser
+
+
+def _condense_batch_item(
+    item: tuple[str, Path, int, PriorityLevel],
+) -> tuple[str, dict]:
+    """Condense a single batch item in a worker process."""
+    if _worker_condenser is None:
+        raise RuntimeError("condense_batch worker was not initialized")
+    return _worker_condenser._condense_content(*item)
@@ -29,9 +29,6 @@ from henriqueslab_updater import (
     show_update_notification,
 )
 
-from .processor import RepositoryProcessor
-from .utils.config import Config
-from .utils.file_utils import find_folder2md_output_files
 from .utils.logging_config import setup_logging
 
 # Configure rich-click for better help formatting
@@ -47,32 +44,17 @@ console = Console()
 
 def _get_template_content() -> str:
     """Load the .folder2md_ignore template content from the package."""
-    try:
-        # Try to get template from package data
-        import importlib.resources as resources
-
-        try:
-            # For Python 3.9+
-            template_files = resources.files("folder2md4llms") / "templates"
-            template_file = template_files / "folder2md_ignore.template"
-            return template_file.read_text(encoding="utf-8")
-        except AttributeError:
-            # Fallback for older Python versions
-            with resources.open_text(
-                "folder2md4llms.templates", "folder2md_ignore.template"
-            ) as f:
-                return f.read()
+    # Only --init-ignore needs the template, so it is read on demand
+    import importlib.resources as resources
 
+    try:
+        template_file = (
+            resources.files("folder2md4llms.templates") / "folder2md_ignore.template"
+        )
+        return template_file.read_text(encoding="utf-8")
     except (ImportError, FileNotFoundError):
-        # Fallback: try to read from file system (development environment)
-        try:
-            template_path = (
-                Path(__file__).parent / "templates" / "folder2md_ignore.template"
-            )
-            return template_path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            # Last resort: return a minimal template
-            return """# folder2md4llms ignore patterns
+        # Last resort: return a minimal template
+        return """# folder2md4llms ignore patterns
 # Add your ignore patterns below (gitignore-style syntax)
 
 # Common patterns
@@ -179,6 +161,12 @@ def _generate_ignore_template(target_path: Path, force: bool = False) -> None:
     help="Disable automatic file analysis and ignore pattern suggestions.",
 )
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging.")
+@click.option(
+    "--stat-threads",
+    type=click.IntRange(1, 64),
+    metavar="N",
+    help="Threads used to stat files before processing. Defaults to max_workers.",
+)
 @click.option(
     "--changelog",
     "changelog_version",
@@ -224,6 +212,7 @@ def main(
     disable_update_check: bool,
     no_suggestions: bool,
     verbose: bool,
+    stat_threads: int | None,
     changelog_version: str | None,
     changelog_recent: int | None,
     upgrade: bool,
@@ -393,6 +382,12 @@ def main(
             _generate_ignore_template(path, force=force)
             return
 
+        # Deferred so --help, --version and the early-exit flags above skip
+        # importing the processing pipeline
+        from .processor import RepositoryProcessor
+        from .utils.config import Config
+        from .utils.file_utils import find_folder2md_output_files
+
         # Setup logging
         log_file = None
         if verbose:
@@ -520,6 +515,8 @@ def main(
             config_obj.condense_code = True
         if no_suggestions:
             config_obj.enable_ignore_suggestions = False
+        if stat_threads:
+            config_obj.stat_threads = stat_threads
 
         if limit:
             config_obj.smart_condensing = True
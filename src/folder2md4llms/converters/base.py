@@ -1,6 +1,7 @@
 """Base converter class for document conversion."""
 
 import logging
+import os
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -8,10 +9,39 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# PDF binary markers, most telling first - made more flexible for line-by-line
+# analysis. Plain substring scans beat a regex alternation on clean text.
+_BINARY_MARKERS = ("%PDF-", "endstream", "endobj", "xref", "<</", "\x00", "\xff")
 # Compiled regex patterns for better performance
-# Match PDF binary patterns - made more flexible for line-by-line analysis
-_BINARY_PATTERN = re.compile(r"%PDF-|xref|<<\/|endobj|endstream|\x00|\xff")
 _NON_PRINTABLE_PATTERN = re.compile(r"[^\x20-\x7E\s]")
+# ASCII bytes _NON_PRINTABLE_PATTERN accepts, deleted via bytes.translate
+_PRINTABLE_ASCII = bytes(
+    c for c in range(128) if not _NON_PRINTABLE_PATTERN.match(chr(c))
+)
+# Non-ASCII characters that ``\s`` matches, i.e. those str.isspace() accepts
+_NON_ASCII_SPACE_PATTERN = re.compile(
+    "[\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+)
+
+
+def _has_binary_marker(text: str) -> bool:
+    """Check whether text contains any of ``_BINARY_MARKERS``."""
+    return any(marker in text for marker in _BINARY_MARKERS)
+
+
+def _count_non_printable(text: str) -> int:
+    """Count characters matched by ``_NON_PRINTABLE_PATTERN``.
+
+    The ASCII part is counted with a single ``bytes.translate`` call instead
+    of materializing every regex match. Every non-ASCII character matches
+    unless it is whitespace, so only those have to be found by regex.
+    """
+    ascii_bytes = text.encode("ascii", "ignore")
+    count = len(ascii_bytes.translate(None, _PRINTABLE_ASCII))
+    non_ascii = len(text) - len(ascii_bytes)
+    if non_ascii:
+        count += non_ascii - len(_NON_ASCII_SPACE_PATTERN.findall(text))
+    return count
 
 
 class BaseConverter(ABC):
@@ -37,10 +67,18 @@ class BaseConverter(ABC):
         """Get the file extensions this converter supports."""
         pass
 
-    def get_file_info(self, file_path: Path) -> dict[str, Any]:
-        """Get basic information about the file."""
+    def get_file_info(
+        self, file_path: Path, stat_result: os.stat_result | None = None
+    ) -> dict[str, Any]:
+        """Get basic information about the file.
+
+        Args:
+            file_path: Path to the file
+            stat_result: Stat result already fetched by the caller, if any;
+                avoids a second stat call for the same file
+        """
         try:
-            stat = file_path.stat()
+            stat = stat_result if stat_result is not None else file_path.stat()
             return {
                 "size": stat.st_size,
                 "modified": stat.st_mtime,
@@ -98,11 +136,11 @@ class BaseConverter(ABC):
                 continue
 
             # Check if line contains PDF/document binary patterns
-            has_binary = _BINARY_PATTERN.search(line) is not None
+            has_binary = _has_binary_marker(line)
 
             # Check if line has excessive non-printable characters (>30% of line)
             if len(line) > 10:
-                non_printable_count = len(_NON_PRINTABLE_PATTERN.findall(line))
+                non_printable_count = _count_non_printable(line)
                 has_excessive_binary = (non_printable_count / len(line)) > 0.3
             else:
                 has_excessive_binary = False
@@ -160,12 +198,13 @@ class BaseConverter(ABC):
             return text
 
         # Check if text contains binary patterns
-        has_binary_patterns = _BINARY_PATTERN.search(text) is not None
+        has_binary_patterns = _has_binary_marker(text)
 
-        # Check for excessive non-printable characters (more than 5% of content)
+        # Check for excessive non-printable characters (more than 5% of content),
+        # unless a binary pattern already decided the outcome
         has_excessive_binary = False
-        if len(text) > 100:
-            non_printable_matches = len(_NON_PRINTABLE_PATTERN.findall(text))
+        if not has_binary_patterns and len(text) > 100:
+            non_printable_matches = _count_non_printable(text)
             has_excessive_binary = (non_printable_matches / len(text)) > 0.05
 
         # If binary content detected, sanitize instead of rejecting
@@ -1,5 +1,6 @@
 """Smart Python converter that integrates with the anti-truncation engine."""
 
+import re
 from pathlib import Path
 
 from ..analyzers.priority_analyzer import ContentPriorityAnalyzer, PriorityLevel
@@ -8,6 +9,8 @@ from ..utils.smart_budget_manager import BudgetAllocation
 from ..utils.token_utils import estimate_tokens_from_text
 from .base import BaseConverter
 
+_NEWLINE_RE = re.compile("\n")
+
 
 class SmartPythonConverter(BaseConverter):
     """Smart Python converter with priority-aware condensing and budget management."""
@@ -122,6 +125,7 @@ class SmartPythonConverter(BaseConverter):
         available_tokens = allocation.allocated_tokens if allocation else None
 
         # If no budget allocation, estimate conservative limit
+        total_tokens: int | None = None
         if available_tokens is None:
             total_tokens = estimate_tokens_from_text(content)
             available_tokens = total_tokens  # No limit if no allocation
@@ -136,6 +140,7 @@ class SmartPythonConverter(BaseConverter):
                 file_path=file_path,
                 available_tokens=available_tokens,
                 priority=file_priority,
+                estimated_tokens=total_tokens,
             )
         else:
             condensed_content = content
@@ -229,6 +234,8 @@ class SmartPythonConverter(BaseConverter):
             else PriorityLevel.MEDIUM
         )
 
+        original_tokens = estimate_tokens_from_text(content)
+
         # Apply progressive condensing
         if self.progressive_condenser:
             (
@@ -239,11 +246,17 @@ class SmartPythonConverter(BaseConverter):
                 file_path=file_path,
                 available_tokens=available_tokens,
                 priority=file_priority,
+                estimated_tokens=original_tokens,
             )
         else:
             condensed_content = content
             condensing_info = {}
 
+        # The condenser already counted the result with the same estimator
+        final_tokens = condensing_info.get("final_tokens")
+        if final_tokens is None:
+            final_tokens = estimate_tokens_from_text(condensed_content)
+
         # Prepare analysis info
         analysis_info = {
             "priority": file_priority.name
@@ -251,8 +264,8 @@ class SmartPythonConverter(BaseConverter):
             else str(file_priority),
             "method": "smart",
             "condensing_info": condensing_info,
-            "original_tokens": estimate_tokens_from_text(content),
-            "final_tokens": estimate_tokens_from_text(condensed_content),
+            "original_tokens": original_tokens,
+            "final_tokens": final_tokens,
         }
 
         # Generate header
@@ -280,20 +293,24 @@ class SmartPythonConverter(BaseConverter):
             import ast
 
             tree = ast.parse(content)
+            # Offsets where each line starts, so function bodies are sliced
+            # straight out of the source instead of split and re-joined
+            line_starts = [0]
+            line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(content))
+            line_count = len(line_starts)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
                     # Extract function content for analysis
-                    lines = content.split("\n")
-                    if hasattr(node, "lineno") and hasattr(node, "end_lineno"):
-                        start = max(0, node.lineno - 1)
-                        end = min(len(lines), node.end_lineno or len(lines))
-                        function_content = "\n".join(lines[start:end])
-
-                        priority = self.priority_analyzer.analyze_function_priority(
-                            function_content
-                        )
-                        function_priorities[node.name] = priority
+                    start = max(0, node.lineno - 1)
+                    end = min(line_count, node.end_lineno or line_count)
+                    stop = line_starts[end] - 1 if end < line_count else len(content)
+                    function_content = content[line_starts[start] : stop]
+
+                    priority = self.priority_analyzer.analyze_function_priority(
+                        function_content
+                    )
+                    function_priorities[node.name] = priority
 
         except SyntaxError:
             pass
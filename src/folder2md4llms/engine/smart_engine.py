@@ -1,10 +1,12 @@
 """Smart anti-truncation engine that orchestrates intelligent content processing."""
 
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 
 from ..analyzers.priority_analyzer import ContentPriorityAnalyzer, PriorityLevel
 from ..analyzers.progressive_condenser import ProgressiveCondenser
+from ..utils.ignore_patterns import IgnorePatterns
 from ..utils.smart_budget_manager import BudgetStrategy, SmartTokenBudgetManager
 from ..utils.token_utils import estimate_tokens_from_text, is_tiktoken_available
 
@@ -100,13 +102,18 @@ class SmartAntiTruncationEngine:
             return estimate_tokens_from_text(text, method=self.token_counting_method)
 
     def analyze_repository(
-        self, file_paths: list[Path], repo_path: Path
+        self,
+        file_paths: list[Path],
+        repo_path: Path,
+        ignore_patterns: IgnorePatterns | None = None,
     ) -> tuple[dict[Path, PriorityLevel], dict[Path, int], dict[Path, float]]:
         """Analyze entire repository to determine priorities and token estimates.
 
         Args:
             file_paths: List of files to analyze
             repo_path: Repository root path
+            ignore_patterns: Ignore patterns of this run, used by the priority
+                analyzer's repository walks
 
         Returns:
             Tuple of (file_priorities, token_estimates, import_scores)
@@ -115,6 +122,11 @@ class SmartAntiTruncationEngine:
         token_estimates = {}
         import_scores = {}
 
+        if self.priority_analyzer:
+            self.priority_analyzer.start_run(ignore_patterns)
+        if self.progressive_condenser:
+            self.progressive_condenser.clear_ast_cache()
+
         # Analyze file priorities and estimate tokens
         for file_path in file_paths:
             try:
@@ -204,40 +216,12 @@ class SmartAntiTruncationEngine:
         if not content.strip():
             return content, {"method": "unchanged", "reason": "empty_content"}
 
-        # Determine available tokens
-        if allocation and "allocated_tokens" in allocation:
-            available_tokens = max(
-                0, allocation["allocated_tokens"]
-            )  # Ensure non-negative
-            priority = allocation.get("priority", PriorityLevel.MEDIUM)
-        else:
-            available_tokens = self._count_tokens(content)
-            priority = PriorityLevel.MEDIUM
-
-        # Ensure available_tokens is always positive
-        if available_tokens <= 0:
-            available_tokens = 100  # Minimum fallback
-
-        processing_info = {
-            "original_tokens": self._count_tokens(content),
-            "available_tokens": available_tokens,
-            "priority": priority.name if hasattr(priority, "name") else str(priority),
-            "method": "smart_engine",
-        }
+        processing_info, priority = self._plan_file_budget(content, allocation)
+        available_tokens = processing_info["available_tokens"]
 
         # Check if condensing is needed
-        original_tokens = processing_info["original_tokens"]
-
-        if original_tokens <= available_tokens:
-            # No condensing needed
-            processing_info.update(
-                {
-                    "method": "unchanged",
-                    "reason": "fits_in_budget",
-                    "final_tokens": original_tokens,
-                }
-            )
-            return content, processing_info
+        if processing_info["original_tokens"] <= available_tokens:
+            return content, self._mark_unchanged(processing_info)
 
         # Apply progressive condensing if enabled
         if self.enable_progressive_condensing and self.progressive_condenser:
@@ -250,33 +234,136 @@ class SmartAntiTruncationEngine:
                 available_tokens=available_tokens,
                 priority=priority,
             )
-
-            processing_info.update(
-                {
-                    "method": "progressive_condensing",
-                    "condensing_info": condensing_info,
-                    "final_tokens": condensing_info.get(
-                        "final_tokens", original_tokens
-                    ),
-                    "tokens_saved": condensing_info.get("tokens_saved", 0),
-                }
-            )
-
-            count = self.stats.get("progressive_condensing_applied", 0)
-            self.stats["progressive_condensing_applied"] = int(count) + 1
-            saved = self.stats.get("total_tokens_saved", 0)
-            self.stats["total_tokens_saved"] = int(saved) + condensing_info.get(
-                "tokens_saved", 0
+            return condensed_content, self._record_condensing(
+                processing_info, condensing_info
             )
 
-            return condensed_content, processing_info
-
         # Last resort: truncate intelligently
         else:
             return self._intelligent_truncate(
                 content, available_tokens, processing_info
             )
 
+    def process_files_with_budget(
+        self,
+        files: Sequence[tuple[Path, str, dict | None]],
+        max_workers: int | None = None,
+    ) -> list[tuple[str, dict]]:
+        """Process several files, condensing the over-budget ones as a batch.
+
+        Each file gets the same treatment as ``process_file_with_budget``;
+        the files that need progressive condensing are handed to
+        ``ProgressiveCondenser.condense_batch`` together so they can be
+        condensed in parallel worker processes.
+
+        Args:
+            files: Sequence of (file_path, content, allocation)
+            max_workers: Worker processes for condensing (defaults to CPU count)
+
+        Returns:
+            List of (processed_content, processing_info) in the order of files
+        """
+        condenser = (
+            self.progressive_condenser if self.enable_progressive_condensing else None
+        )
+        results: list[tuple[str, dict] | None] = [None] * len(files)
+        batch: list[tuple[str, Path, int, PriorityLevel]] = []
+        batch_info: list[tuple[int, dict]] = []
+
+        for index, (file_path, content, allocation) in enumerate(files):
+            if condenser is None or not content.strip():
+                results[index] = self.process_file_with_budget(
+                    file_path, content, allocation
+                )
+                continue
+
+            processing_info, priority = self._plan_file_budget(content, allocation)
+            available_tokens = processing_info["available_tokens"]
+            if processing_info["original_tokens"] <= available_tokens:
+                results[index] = content, self._mark_unchanged(processing_info)
+                continue
+
+            batch.append((content, file_path, available_tokens, priority))
+            batch_info.append((index, processing_info))
+
+        if condenser is not None and batch:
+            condensed = condenser.condense_batch(batch, max_workers=max_workers)
+            for (index, processing_info), (content, condensing_info) in zip(
+                batch_info, condensed, strict=True
+            ):
+                results[index] = (
+                    content,
+                    self._record_condensing(processing_info, condensing_info),
+                )
+
+        return [result for result in results if result is not None]
+
+    def _plan_file_budget(
+        self, content: str, allocation: dict | None
+    ) -> tuple[dict, PriorityLevel]:
+        """Work out a file's token budget and priority.
+
+        Returns:
+            Tuple of (processing_info, priority); processing_info carries the
+            original and available token counts
+        """
+        # Count once; the budget fallback below reuses the same estimate
+        original_tokens = self._count_tokens(content)
+
+        # Determine available tokens
+        if allocation and "allocated_tokens" in allocation:
+            available_tokens = max(
+                0, allocation["allocated_tokens"]
+            )  # Ensure non-negative
+            priority = allocation.get("priority", PriorityLevel.MEDIUM)
+        else:
+            available_tokens = original_tokens
+            priority = PriorityLevel.MEDIUM
+
+        # Ensure available_tokens is always positive
+        if available_tokens <= 0:
+            available_tokens = 100  # Minimum fallback
+
+        processing_info = {
+            "original_tokens": original_tokens,
+            "available_tokens": available_tokens,
+            "priority": priority.name if hasattr(priority, "name") else str(priority),
+            "method": "smart_engine",
+        }
+        return processing_info, priority
+
+    def _mark_unchanged(self, processing_info: dict) -> dict:
+        """Complete processing info for a file that already fits its budget."""
+        processing_info.update(
+            {
+                "method": "unchanged",
+                "reason": "fits_in_budget",
+                "final_tokens": processing_info["original_tokens"],
+            }
+        )
+        return processing_info
+
+    def _record_condensing(self, processing_info: dict, condensing_info: dict) -> dict:
+        """Fold a progressive condensing result into processing info and stats."""
+        processing_info.update(
+            {
+                "method": "progressive_condensing",
+                "condensing_info": condensing_info,
+                "final_tokens": condensing_info.get(
+                    "final_tokens", processing_info["original_tokens"]
+                ),
+                "tokens_saved": condensing_info.get("tokens_saved", 0),
+            }
+        )
+
+        count = self.stats.get("progressive_condensing_applied", 0)
+        self.stats["progressive_condensing_applied"] = int(count) + 1
+        saved = self.stats.get("total_tokens_saved", 0)
+        self.stats["total_tokens_saved"] = int(saved) + condensing_info.get(
+            "tokens_saved", 0
+        )
+        return processing_info
+
     def _intelligent_truncate(
         self, content: str, available_tokens: int, processing_info: dict
     ) -> tuple[str, dict]:
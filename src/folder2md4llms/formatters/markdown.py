@@ -9,7 +9,7 @@ from pygments.util import ClassNotFound
 
 from ..__version__ import __version__
 from ..utils.file_utils import get_language_from_extension
-from ..utils.token_utils import estimate_tokens_from_text
+from ..utils.token_utils import estimate_tokens_from_text, token_count_upper_bound
 
 
 class MarkdownFormatter:
@@ -233,10 +233,8 @@ class MarkdownFormatter:
                 output, truncation_info, processing_stats
             )
 
-        # Final safety: Clean any surrogate characters that might have slipped through
-        # This prevents encoding errors when writing to file or clipboard
-        output = output.encode("utf-8", errors="replace").decode("utf-8")
-
+        # Every section was cleaned of surrogates above and _apply_limits
+        # re-checks the joined output, so it is safe to write or copy as is
         return output
 
     def _apply_limits(self, content: str) -> tuple[str, dict | None]:
@@ -274,8 +272,8 @@ class MarkdownFormatter:
                 truncation_info,
             )
 
-        # Check token limit
-        if self.token_limit:
+        # Check token limit; content that cannot exceed it is never estimated
+        if self.token_limit and token_count_upper_bound(content) > self.token_limit:
             estimated_tokens = estimate_tokens_from_text(
                 content, self.token_estimation_method
             )
@@ -1,7 +1,10 @@
 """Main repository processor for folder2md4llms."""
 
 import logging
+import os
 from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +19,7 @@ from .formatters.markdown import MarkdownFormatter
 from .utils.config import Config
 from .utils.file_strategy import ProcessingAction
 from .utils.file_utils import (
+    bulk_stat,
     get_language_from_extension,
     is_data_file,
     is_text_file,
@@ -54,6 +58,31 @@ def _format_file_size(size_bytes: int) -> str:
     return f"{size:.1f}TB"
 
 
+def _entry_is(check: Callable[[], bool]) -> bool:
+    """Run a DirEntry type check, treating OSError as False like Path does."""
+    try:
+        return check()
+    except OSError:
+        return False
+
+
+def _allocation_as_dict(allocation: Any) -> dict | None:
+    """Turn a budget allocation into the dict the smart engine expects.
+
+    Allocations are slotted dataclasses without a ``__dict__``, so their
+    fields are read explicitly; plain dicts and other objects pass through.
+    """
+    if not allocation:
+        return None
+    if isinstance(allocation, dict):
+        return allocation
+    if is_dataclass(allocation):
+        return {
+            field.name: getattr(allocation, field.name) for field in fields(allocation)
+        }
+    return getattr(allocation, "__dict__", None)
+
+
 def _format_size_limit_warning(rel_path: str, file_size: int, max_size: int) -> str:
     """Format a helpful warning message for files exceeding size limit.
 
@@ -359,7 +388,12 @@ class RepositoryProcessor:
                 # Ensure we're not escaping the repo root
                 path.relative_to(repo_path)
 
-                for item in path.iterdir():
+                # Materialize the listing so its handle is closed before recursing
+                with os.scandir(path) as entries:
+                    dir_entries = list(entries)
+
+                for entry in dir_entries:
+                    item = Path(entry.path)
                     # Additional safety check
                     try:
                         item.relative_to(repo_path)
@@ -367,19 +401,22 @@ class RepositoryProcessor:
                         logger.warning(f"Skipping file outside repo: {item}")
                         continue
 
+                    # DirEntry answers these from the directory listing, so
+                    # only symlinks cost an extra stat call
+                    is_dir = _entry_is(entry.is_dir)
                     if self.ignore_patterns and self.ignore_patterns.should_ignore(
-                        item, repo_path
+                        item, repo_path, is_directory=is_dir
                     ):
                         continue
 
-                    if item.is_file():
+                    if _entry_is(entry.is_file):
                         files.append(item)
                         # Analyze files that will be processed for suggestions
                         if self.ignore_suggester:
                             self.ignore_suggester.analyze_path(item, repo_path)
                         if progress and task:
                             progress.update(task, advance=1)
-                    elif item.is_dir():
+                    elif is_dir:
                         # Analyze directories for suggestions
                         if self.ignore_suggester:
                             self.ignore_suggester.analyze_path(item, repo_path)
@@ -408,6 +445,13 @@ class RepositoryProcessor:
 
         return files
 
+    def _stat_threads(self) -> int:
+        """Number of threads for the file stat sweep."""
+        stat_threads = getattr(self.config, "stat_threads", None)
+        if stat_threads is None:
+            return int(getattr(self.config, "max_workers", 4))
+        return int(stat_threads)
+
     def _process_files(
         self,
         file_list: list[Path],
@@ -493,6 +537,7 @@ class RepositoryProcessor:
                         stats["languages"]["unknown"] += 1
 
         # Process non-text files with traditional approach
+        file_stats = bulk_stat(other_files, self._stat_threads())
         for file_path in other_files:
             try:
                 # Update progress
@@ -503,20 +548,19 @@ class RepositoryProcessor:
                 rel_path = str(file_path.relative_to(repo_path))
 
                 # Get file stats
-                try:
-                    file_size = file_path.stat().st_size
-                    stats["total_size"] += file_size
-
-                    # Skip files that are too large
-                    if file_size > self.config.max_file_size:
-                        logger.info(
-                            _format_size_limit_warning(
-                                rel_path, file_size, self.config.max_file_size
-                            )
+                file_stat = file_stats.get(file_path)
+                if file_stat is None:
+                    continue
+                file_size = file_stat.st_size
+                stats["total_size"] += file_size
+
+                # Skip files that are too large
+                if file_size > self.config.max_file_size:
+                    logger.info(
+                        _format_size_limit_warning(
+                            rel_path, file_size, self.config.max_file_size
                         )
-                        continue
-
-                except OSError:
+                    )
                     continue
 
                 # Use centralized strategy for processing decisions
@@ -574,6 +618,51 @@ class RepositoryProcessor:
         results["stats"] = dict(stats)
         return results
 
+    def _process_text_entries_with_budget(
+        self, entries: list[tuple[Path, str, str, dict | None]]
+    ) -> list[tuple[str, dict] | None]:
+        """Run read text files through the smart engine's budgeted processing.
+
+        Files are processed as one batch so over-budget files can be
+        condensed in parallel. If the batch fails, each file is retried on
+        its own so one bad file only drops that file.
+
+        Args:
+            entries: Sequence of (file_path, rel_path, content, allocation)
+
+        Returns:
+            (processed_content, processing_info) per entry, or None for
+            entries that could not be processed
+        """
+        if self.smart_engine is None or not entries:
+            return []
+
+        files = [
+            (file_path, content, allocation)
+            for file_path, _, content, allocation in entries
+        ]
+        try:
+            return list(
+                self.smart_engine.process_files_with_budget(
+                    files, max_workers=int(getattr(self.config, "max_workers", 4))
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Batch processing failed, processing files one by one: {e}")
+
+        processed: list[tuple[str, dict] | None] = []
+        for file_path, content, allocation in files:
+            try:
+                processed.append(
+                    self.smart_engine.process_file_with_budget(
+                        file_path, content, allocation
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {e}")
+                processed.append(None)
+        return processed
+
     def _process_files_with_smart_engine(
         self,
         file_list: list[Path],
@@ -589,7 +678,17 @@ class RepositoryProcessor:
             file_priorities,
             token_estimates,
             import_scores,
-        ) = self.smart_engine.analyze_repository(file_list, repo_path)
+        ) = self.smart_engine.analyze_repository(
+            file_list, repo_path, self.ignore_patterns
+        )
+        # The smart converter's analyzer walks the same tree for this run
+        if (
+            self.smart_python_converter
+            and self.smart_python_converter.priority_analyzer
+        ):
+            self.smart_python_converter.priority_analyzer.start_run(
+                self.ignore_patterns
+            )
 
         # Allocate budgets based on priorities
         budget_allocations = self.smart_engine.allocate_budgets(
@@ -636,90 +735,90 @@ class RepositoryProcessor:
             else:
                 other_files.append(file_path)
 
-        # Process text files with smart engine
-        if text_files:
-            for file_path in text_files:
-                try:
-                    if progress and task:
-                        progress.update(task, advance=1)
-
-                    rel_path = str(file_path.relative_to(repo_path))
+        # Read text files first so over-budget ones are condensed as one batch
+        text_entries: list[tuple[Path, str, str, dict | None]] = []
+        for file_path in text_files:
+            try:
+                if progress and task:
+                    progress.update(task, advance=1)
 
-                    # Get budget allocation
-                    allocation = budget_allocations.get(file_path)
+                rel_path = str(file_path.relative_to(repo_path))
 
-                    # Read file content
+                # Read file content
+                try:
+                    # Read with surrogateescape to preserve problematic bytes, then clean them
                     try:
-                        # Read with surrogateescape to preserve problematic bytes, then clean them
-                        try:
-                            with open(
-                                file_path, encoding="utf-8", errors="surrogateescape"
-                            ) as f:
-                                content = f.read()
-                                # Immediately clean surrogates
-                                content = content.encode(
-                                    "utf-8", errors="replace"
-                                ).decode("utf-8")
-                        except UnicodeDecodeError:
-                            # Fallback to latin-1 which accepts all bytes
-                            with open(file_path, encoding="latin-1") as f:
-                                content = f.read()
-                                # Clean to ensure valid UTF-8
-                                content = content.encode(
-                                    "utf-8", errors="replace"
-                                ).decode("utf-8")
-                    except (OSError, UnicodeDecodeError):
-                        continue
-
-                    # Process with smart engine
-                    allocation_dict = None
-                    if allocation and hasattr(allocation, "__dict__"):
-                        allocation_dict = allocation.__dict__
-                    elif allocation and isinstance(allocation, dict):
-                        allocation_dict = allocation
-
-                    (
-                        processed_content,
-                        processing_info,
-                    ) = self.smart_engine.process_file_with_budget(
-                        file_path, content, allocation_dict
-                    )
-
-                    results["text_files"][rel_path] = processed_content
-                    stats["text_files"] += 1
-                    stats["text_size"] += len(processed_content.encode("utf-8"))
-                    if isinstance(processing_info, dict):
-                        stats["estimated_tokens"] += processing_info.get(
-                            "final_tokens", 0
-                        )
+                        with open(
+                            file_path, encoding="utf-8", errors="surrogateescape"
+                        ) as f:
+                            content = f.read()
+                            # Immediately clean surrogates
+                            content = content.encode("utf-8", errors="replace").decode(
+                                "utf-8"
+                            )
+                    except UnicodeDecodeError:
+                        # Fallback to latin-1 which accepts all bytes
+                        with open(file_path, encoding="latin-1") as f:
+                            content = f.read()
+                            # Clean to ensure valid UTF-8
+                            content = content.encode("utf-8", errors="replace").decode(
+                                "utf-8"
+                            )
+                except (OSError, UnicodeDecodeError):
+                    continue
 
-                    # Track original and condensed tokens for smart condensing stats
-                    if isinstance(processing_info, dict):
-                        original_tokens = processing_info.get("original_tokens", 0)
-                        final_tokens = processing_info.get("final_tokens", 0)
-                    else:
-                        original_tokens = 0
-                        final_tokens = 0
-                    original_tokens_total += original_tokens
-                    condensed_tokens_total += final_tokens
+                # Get budget allocation
+                allocation_dict = _allocation_as_dict(budget_allocations.get(file_path))
+                text_entries.append((file_path, rel_path, content, allocation_dict))
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {e}")
+                continue
 
-                    # Track language
-                    language = get_language_from_extension(file_path.suffix.lower())
-                    if language:
-                        stats["languages"][language] += 1
-                    else:
-                        stats["languages"]["unknown"] += 1
+        # Process with smart engine
+        processed_entries = self._process_text_entries_with_budget(text_entries)
 
-                    # Update smart engine stats
-                    if self.smart_engine and hasattr(self.smart_engine, "stats"):
-                        count = self.smart_engine.stats.get("files_processed", 0)
-                        self.smart_engine.stats["files_processed"] = int(count) + 1
+        for (file_path, rel_path, _, _), processed in zip(
+            text_entries, processed_entries, strict=True
+        ):
+            if processed is None:
+                continue
+            try:
+                processed_content, processing_info = processed
+
+                results["text_files"][rel_path] = processed_content
+                stats["text_files"] += 1
+                stats["text_size"] += len(processed_content.encode("utf-8"))
+                if isinstance(processing_info, dict):
+                    stats["estimated_tokens"] += processing_info.get("final_tokens", 0)
+
+                # Track original and condensed tokens for smart condensing stats
+                if isinstance(processing_info, dict):
+                    original_tokens = processing_info.get("original_tokens", 0)
+                    final_tokens = processing_info.get("final_tokens", 0)
+                else:
+                    original_tokens = 0
+                    final_tokens = 0
+                original_tokens_total += original_tokens
+                condensed_tokens_total += final_tokens
+
+                # Track language
+                language = get_language_from_extension(file_path.suffix.lower())
+                if language:
+                    stats["languages"][language] += 1
+                else:
+                    stats["languages"]["unknown"] += 1
+
+                # Update smart engine stats
+                if self.smart_engine and hasattr(self.smart_engine, "stats"):
+                    count = self.smart_engine.stats.get("files_processed", 0)
+                    self.smart_engine.stats["files_processed"] = int(count) + 1
 
-                except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {e}")
-                    continue
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {e}")
+                continue
 
         # Process other files (converted docs, binaries, etc.) with existing logic
+        file_stats = bulk_stat(other_files, self._stat_threads())
         for file_path in other_files:
             try:
                 if progress and task:
@@ -728,20 +827,19 @@ class RepositoryProcessor:
                 rel_path = str(file_path.relative_to(repo_path))
 
                 # Get file stats
-                try:
-                    file_size = file_path.stat().st_size
-                    stats["total_size"] += file_size
-
-                    # Skip files that are too large
-                    if file_size > self.config.max_file_size:
-                        logger.info(
-                            _format_size_limit_warning(
-                                rel_path, file_size, self.config.max_file_size
-                            )
+                file_stat = file_stats.get(file_path)
+                if file_stat is None:
+                    continue
+                file_size = file_stat.st_size
+                stats["total_size"] += file_size
+
+                # Skip files that are too large
+                if file_size > self.config.max_file_size:
+                    logger.info(
+                        _format_size_limit_warning(
+                            rel_path, file_size, self.config.max_file_size
                         )
-                        continue
-
-                except OSError:
+                    )
                     continue
 
                 # Process with smart Python converter if available and applicable
@@ -787,11 +885,7 @@ class RepositoryProcessor:
                             self.smart_engine and len(converted_content) > 1000
                         ):  # Only for substantial content
                             allocation = budget_allocations.get(file_path)
-                            allocation_dict = None
-                            if allocation and hasattr(allocation, "__dict__"):
-                                allocation_dict = allocation.__dict__
-                            elif allocation and isinstance(allocation, dict):
-                                allocation_dict = allocation
+                            allocation_dict = _allocation_as_dict(allocation)
 
                             (
                                 processed_content,
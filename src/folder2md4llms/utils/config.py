@@ -30,6 +30,7 @@ class Config:
         "char_limit": {"min": 100, "max": 50000000},
         "max_file_size": {"min": 1024, "max": 1073741824},  # 1KB to 1GB
         "max_workers": {"min": 1, "max": 32},
+        "stat_threads": {"min": 1, "max": 64},
         "max_memory_mb": {"min": 128, "max": 65536},
         "pdf_max_pages": {"min": 1, "max": 10000},
         "xlsx_max_sheets": {"min": 1, "max": 1000},
@@ -70,6 +71,7 @@ class Config:
 
         # Performance settings
         self.max_workers = DEFAULT_MAX_WORKERS
+        self.stat_threads: int | None = None  # Defaults to max_workers
         self.progress_bar = True
 
         # Streaming and token management
@@ -259,6 +261,7 @@ class Config:
             "syntax_highlighting": self.syntax_highlighting,
             "file_size_limit": self.file_size_limit,
             "max_workers": self.max_workers,
+            "stat_threads": self.stat_threads,
             "progress_bar": self.progress_bar,
             "token_estimation_method": self.token_estimation_method,
             "max_memory_mb": self.max_memory_mb,
@@ -332,6 +335,7 @@ syntax_highlighting: true
 file_size_limit: 104857600  # 100MB
 # Performance settings
 max_workers: 4
+# stat_threads: 8  # Threads for the file stat sweep (defaults to max_workers)
 progress_bar: true
 
 # Streaming and token management
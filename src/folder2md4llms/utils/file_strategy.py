@@ -33,7 +33,7 @@ class ProcessingAction(Enum):
     ANALYZE_BINARY = "analyze_binary"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileProcessingStrategy:
     """Complete strategy for processing a file."""
 
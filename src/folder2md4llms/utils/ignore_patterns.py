@@ -1,9 +1,108 @@
 """Ignore patterns handling for filtering files."""
 
 import fnmatch
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
+# fnmatch matches case-insensitively wherever the OS does (e.g. Windows)
+_FNMATCH_FLAGS = "(?i:" if os.path.normcase("A") == "a" else "(?:"
+
+# Upper bound on memoized should_ignore results per IgnorePatterns
+_MATCH_CACHE_SIZE = 65536
+
+
+def _glob_to_regex(pattern: str, within_segment: bool) -> str:
+    """Translate an fnmatch-style glob into a regex body.
+
+    With ``within_segment`` the wildcards and character classes never match
+    "/", so the result describes a single path segment.
+    """
+    star, any_char, guard = (
+        ("[^/]*", "[^/]", "(?!/)") if within_segment else (".*", ".", "")
+    )
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            while i < n and pattern[i] == "*":
+                i += 1
+            parts.append(star)
+        elif char == "?":
+            parts.append(any_char)
+        elif char == "[":
+            # Find the closing bracket the same way fnmatch does
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            j = pattern.find("]", j)
+            if j < 0:
+                parts.append(re.escape(char))
+                continue
+            # Let fnmatch translate the class itself: "(?s:[...])\\Z"
+            parts.append(guard + fnmatch.translate(pattern[i - 1 : j + 1])[4:-3])
+            i = j + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def _pattern_regex(pattern: str) -> str | None:
+    """Build a regex equivalent to ``_matches_gitignore_pattern`` for one pattern.
+
+    The regex is meant for ``re.match`` with ``re.DOTALL``. Returns None for
+    patterns that can never match.
+    """
+    if not pattern:
+        return None
+    if "**" in pattern:
+        regex = pattern.replace("**", ".*").replace("*", "[^/]*")
+        try:
+            re.compile(regex)
+        except re.error:
+            return None
+        # Used verbatim as a prefix match, case-sensitive and without DOTALL
+        return f"(?-s:{regex})"
+    if "/" in pattern:
+        return f"{_FNMATCH_FLAGS}{_glob_to_regex(pattern, False)})\\Z"
+    # Matches if any path segment matches
+    segment = _glob_to_regex(pattern, True)
+    return f"(?:.*/)?{_FNMATCH_FLAGS}{segment})(?:/.*)?\\Z"
+
+
+def _build_union_regex(
+    patterns: list[tuple[str, bool, bool]],
+) -> re.Pattern[str] | None:
+    """Fold parsed patterns into one regex that matches ignored paths.
+
+    Last match wins, so each negation wraps everything before it in a negative
+    lookahead. Returns None if the combined regex cannot be compiled.
+    """
+    regex = "(?!)"
+    positives: list[str] = []
+    for pattern, is_negated, _ in patterns:
+        pattern_regex = _pattern_regex(pattern)
+        if pattern_regex is None:
+            continue
+        if not is_negated:
+            positives.append(pattern_regex)
+            continue
+        if positives:
+            regex = "(?:" + "|".join([*positives, regex]) + ")"
+            positives = []
+        regex = f"(?!{pattern_regex})(?:{regex})"
+    if positives:
+        regex = "(?:" + "|".join([*positives, regex]) + ")"
+    try:
+        return re.compile(regex, re.DOTALL)
+    except (re.error, RecursionError):
+        return None
+
 
 class IgnorePatterns:
     """Handles file and directory ignore patterns."""
@@ -106,8 +205,19 @@ class IgnorePatterns:
         """Initialize with custom patterns or defaults."""
         self.patterns = patterns or self.DEFAULT_PATTERNS.copy()
         self.loaded_files = loaded_files or []
+        self._refresh_patterns()
+
+    def _refresh_patterns(self) -> None:
+        """Re-derive parsed and compiled patterns after self.patterns changes."""
         self.parsed_patterns = self._parse_patterns()
         self.compiled_patterns = self._compile_patterns()
+        # Directory-only patterns never match files, so files skip them
+        self._file_patterns = [entry for entry in self.parsed_patterns if not entry[2]]
+        # All patterns folded into one regex each, so a lookup is one match
+        self._directory_regex = _build_union_regex(self.parsed_patterns)
+        self._file_regex = _build_union_regex(self._file_patterns)
+        # Results depend only on the patterns, so they are dropped with them
+        self._match_cache: dict[tuple[str, bool], bool] = {}
 
     def _parse_patterns(self) -> list[tuple[str, bool, bool]]:
         """Parse patterns to extract pattern, negation, and directory flags.
@@ -156,8 +266,17 @@ class IgnorePatterns:
                 continue
         return compiled
 
-    def should_ignore(self, path: Path, base_path: Path) -> bool:
-        """Check if a path should be ignored with gitignore-style negation support."""
+    def should_ignore(
+        self, path: Path, base_path: Path, is_directory: bool | None = None
+    ) -> bool:
+        """Check if a path should be ignored with gitignore-style negation support.
+
+        Args:
+            path: The path to check
+            base_path: Root the patterns are relative to
+            is_directory: Whether path is a directory, if the caller already
+                knows; otherwise it is looked up on the filesystem
+        """
         # Get relative path from base
         try:
             rel_path = path.relative_to(base_path)
@@ -167,22 +286,57 @@ class IgnorePatterns:
 
         # Convert to string with forward slashes (for consistency)
         path_str = str(rel_path).replace("\\", "/")
-        is_directory = path.is_dir()
+        if is_directory is None:
+            is_directory = path.is_dir()
+
+        key = (path_str, is_directory)
+        ignored = self._match_cache.get(key)
+        if ignored is None:
+            ignored = self._match_path(path_str, is_directory)
+            if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+                del self._match_cache[next(iter(self._match_cache))]
+            self._match_cache[key] = ignored
+        return ignored
+
+    def _match_path(self, path_str: str, is_directory: bool) -> bool:
+        """Match a relative path against the patterns, last match wins."""
+        # Directory-only patterns are already left out for files
+        union = self._directory_regex if is_directory else self._file_regex
+        if union is not None:
+            return union.match(path_str) is not None
 
         # Process patterns in order, last match wins
         # This ensures higher priority files (target directory) override lower priority ones
         should_ignore = False
 
-        for pattern, is_negated, is_directory_only in self.parsed_patterns:
-            # Skip directory-only patterns for files
-            if is_directory_only and not is_directory:
-                continue
-
+        patterns = self.parsed_patterns if is_directory else self._file_patterns
+        for pattern, is_negated, _ in patterns:
             if self._matches_gitignore_pattern(path_str, pattern, is_directory):
                 should_ignore = not is_negated
 
         return should_ignore
 
+    def walk(self, root: Path) -> Iterator[tuple[Path, list[str], list[str]]]:
+        """Walk a directory tree like ``os.walk``, pruning ignored directories.
+
+        Ignored directories are dropped before they are descended into, so
+        their contents are never listed. File names are yielded unfiltered.
+
+        Args:
+            root: Directory to walk; patterns are matched relative to it
+
+        Yields:
+            Tuples of (directory, subdirectory names, file names)
+        """
+        for dirpath, dirnames, filenames in os.walk(root):
+            directory = Path(dirpath)
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if not self.should_ignore(directory / name, root, is_directory=True)
+            ]
+            yield directory, dirnames, filenames
+
     def _matches_gitignore_pattern(
         self, path_str: str, pattern: str, is_directory: bool
     ) -> bool:
@@ -263,15 +417,13 @@ class IgnorePatterns:
         """Add a new ignore pattern."""
         if pattern not in self.patterns:
             self.patterns.append(pattern)
-            self.parsed_patterns = self._parse_patterns()
-            self.compiled_patterns = self._compile_patterns()
+            self._refresh_patterns()
 
     def remove_pattern(self, pattern: str) -> None:
         """Remove an ignore pattern."""
         if pattern in self.patterns:
             self.patterns.remove(pattern)
-            self.parsed_patterns = self._parse_patterns()
-            self.compiled_patterns = self._compile_patterns()
+            self._refresh_patterns()
 
     @classmethod
     def from_file(cls, ignore_file: Path) -> "IgnorePatterns":
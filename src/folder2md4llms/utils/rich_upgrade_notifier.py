@@ -5,7 +5,11 @@ from rich.console import Console
 
 
 class RichUpgradeNotifier:
-    """Adapt Rich console to UpgradeNotifier protocol for folder2md4llms."""
+    """Adapt Rich console to UpgradeNotifier protocol for folder2md4llms.
+
+    Multi-line messages are printed inside ``with self.console:`` so Rich
+    buffers them and writes each block to the terminal once.
+    """
 
     def __init__(self, console: Console):
         """Initialize with Rich console instance.
@@ -27,16 +31,17 @@ class RichUpgradeNotifier:
             latest: Latest available version
             available: Whether an update is available
         """
-        self.console.print(f"Current version: [cyan]v{current}[/cyan]")
-        if available:
-            self.console.print(
-                f"Latest version: [green bold]v{latest}[/green bold]"
-            )
-            self.console.print("✨ Update available!", style="yellow")
-        else:
-            self.console.print(
-                "✓ You are already using the latest version", style="green"
-            )
+        with self.console:
+            self.console.print(f"Current version: [cyan]v{current}[/cyan]")
+            if available:
+                self.console.print(
+                    f"Latest version: [green bold]v{latest}[/green bold]"
+                )
+                self.console.print("✨ Update available!", style="yellow")
+            else:
+                self.console.print(
+                    "✓ You are already using the latest version", style="green"
+                )
 
     def show_update_info(self, current: str, latest: str, release_url: str) -> None:
         """Show update available information.
@@ -46,13 +51,14 @@ class RichUpgradeNotifier:
             latest: Latest version
             release_url: URL to release notes
         """
-        self.console.print()
-        self.console.print(
-            f"Update available: [cyan]v{current}[/cyan] → [green bold]v{latest}[/green bold]",
-            style="yellow",
-        )
-        self.console.print(f"Release notes: [link]{release_url}[/link]")
-        self.console.print()
+        with self.console:
+            self.console.print()
+            self.console.print(
+                f"Update available: [cyan]v{current}[/cyan] → [green bold]v{latest}[/green bold]",
+                style="yellow",
+            )
+            self.console.print(f"Release notes: [link]{release_url}[/link]")
+            self.console.print()
 
     def show_installer_info(self, friendly_name: str, command: str) -> None:
         """Show detected installer information.
@@ -61,12 +67,13 @@ class RichUpgradeNotifier:
             friendly_name: Human-readable installer name
             command: The upgrade command that will be executed
         """
-        self.console.print()
-        self.console.print(
-            f"Detected installer: [bold]{friendly_name}[/bold]", style="blue"
-        )
-        self.console.print(f"Running: [yellow]{command}[/yellow]")
-        self.console.print()
+        with self.console:
+            self.console.print()
+            self.console.print(
+                f"Detected installer: [bold]{friendly_name}[/bold]", style="blue"
+            )
+            self.console.print(f"Running: [yellow]{command}[/yellow]")
+            self.console.print()
 
     def show_success(self, version: str) -> None:
         """Show successful upgrade message.
@@ -74,19 +81,20 @@ class RichUpgradeNotifier:
         Args:
             version: Version that was successfully installed
         """
-        self.console.print()
-        self.console.print(
-            f"✓ Successfully upgraded to [green bold]v{version}[/green bold]",
-            style="green",
-        )
-        self.console.print()
-        self.console.print(
-            "Please restart your terminal or reload your shell",
-            style="yellow dim",
-        )
-        self.console.print(
-            "to ensure the new version is loaded.", style="yellow dim"
-        )
+        with self.console:
+            self.console.print()
+            self.console.print(
+                f"✓ Successfully upgraded to [green bold]v{version}[/green bold]",
+                style="green",
+            )
+            self.console.print()
+            self.console.print(
+                "Please restart your terminal or reload your shell",
+                style="yellow dim",
+            )
+            self.console.print(
+                "to ensure the new version is loaded.", style="yellow dim"
+            )
 
     def show_error(self, error: str | None) -> None:
         """Show upgrade error message.
@@ -94,13 +102,14 @@ class RichUpgradeNotifier:
         Args:
             error: Error message or None
         """
-        self.console.print()
-        self.console.print("✗ Upgrade failed", style="red bold")
-        self.console.print()
-        if error:
-            self.console.print("Error:", style="red")
-            self.console.print(error)
+        with self.console:
             self.console.print()
+            self.console.print("✗ Upgrade failed", style="red bold")
+            self.console.print()
+            if error:
+                self.console.print("Error:", style="red")
+                self.console.print(error)
+                self.console.print()
 
     def show_manual_instructions(self, install_method: str) -> None:
         """Show manual upgrade instructions.
@@ -108,24 +117,29 @@ class RichUpgradeNotifier:
         Args:
             install_method: The detected installation method
         """
-        self.console.print("Manual upgrade:", style="yellow bold")
-        if install_method == "homebrew":
-            self.console.print("  [cyan]brew update && brew upgrade folder2md4llms[/cyan]")
-        elif install_method == "pipx":
-            self.console.print("  [cyan]pipx upgrade folder2md4llms[/cyan]")
-        elif install_method == "uv":
-            self.console.print("  [cyan]uv tool upgrade folder2md4llms[/cyan]")
-        elif install_method == "dev":
-            self.console.print(
-                "  [cyan]cd <repo> && git pull && uv sync[/cyan]",
-                style="dim",
-            )
-        else:
-            self.console.print("  [cyan]pip install --upgrade folder2md4llms[/cyan]")
-            self.console.print("  [dim]# Or with --user flag:[/dim]")
-            self.console.print(
-                "  [cyan]pip install --upgrade --user folder2md4llms[/cyan]"
-            )
+        with self.console:
+            self.console.print("Manual upgrade:", style="yellow bold")
+            if install_method == "homebrew":
+                self.console.print(
+                    "  [cyan]brew update && brew upgrade folder2md4llms[/cyan]"
+                )
+            elif install_method == "pipx":
+                self.console.print("  [cyan]pipx upgrade folder2md4llms[/cyan]")
+            elif install_method == "uv":
+                self.console.print("  [cyan]uv tool upgrade folder2md4llms[/cyan]")
+            elif install_method == "dev":
+                self.console.print(
+                    "  [cyan]cd <repo> && git pull && uv sync[/cyan]",
+                    style="dim",
+                )
+            else:
+                self.console.print(
+                    "  [cyan]pip install --upgrade folder2md4llms[/cyan]"
+                )
+                self.console.print("  [dim]# Or with --user flag:[/dim]")
+                self.console.print(
+                    "  [cyan]pip install --upgrade --user folder2md4llms[/cyan]"
+                )
 
     def confirm_upgrade(self, version: str) -> bool:
         """Prompt user for confirmation using click.
@@ -137,9 +151,7 @@ class RichUpgradeNotifier:
             True if user confirms, False otherwise
         """
         try:
-            return click.confirm(
-                f"Upgrade folder2md4llms to v{version}?", default=True
-            )
+            return click.confirm(f"Upgrade folder2md4llms to v{version}?", default=True)
         except (KeyboardInterrupt, EOFError):
             self.console.print("\n⚠ Upgrade cancelled.", style="yellow")
             return False
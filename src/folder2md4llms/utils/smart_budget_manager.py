@@ -15,7 +15,7 @@ class BudgetStrategy(Enum):
     AGGRESSIVE = "aggressive"  # More tokens for medium/low priority content
 
 
-@dataclass
+@dataclass(slots=True)
 class CondensingAdjustment:
     """Represents a suggested adjustment to condensing level."""
 
@@ -26,7 +26,7 @@ class CondensingAdjustment:
     tokens_saved: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetAllocation:
     """Represents token budget allocation for a file."""
 
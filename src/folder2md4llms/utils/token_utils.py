@@ -197,6 +197,25 @@ def estimate_tokens_from_text(
     return int(char_count / ratio)
 
 
+def token_count_upper_bound(text: str) -> int:
+    """Cheap upper bound on what estimate_tokens_from_text can return for text.
+
+    Character-based estimates never exceed one token per character, and a
+    tiktoken token always covers at least one UTF-8 byte, so the UTF-8
+    length bounds every method. ``str.isascii`` is O(1), so ASCII text needs
+    no scan; other text falls back to the four-bytes-per-character maximum.
+
+    Args:
+        text: The text to bound
+
+    Returns:
+        A token count no estimation method will exceed
+    """
+    if text.isascii():
+        return len(text)
+    return len(text) * 4
+
+
 def estimate_tokens_from_file(
     file_path: Path, method: str = "average", model_name: str | None = None
 ) -> int:
@@ -305,7 +324,7 @@ def _is_likely_code(text: str) -> bool:
     ]
 
     # Count lines that match code patterns
-    lines = text.split("\n")[:50]  # Check first 50 lines
+    lines = text.split("\n", 50)[:50]  # Check first 50 lines
     code_lines = 0
 
     for line in lines:
@@ -50,27 +50,28 @@ class TreeGenerator:
             # Sort items: directories first, then files
             filtered_items.sort(key=lambda x: (x.is_file(), x.name.lower()))
 
+            # Build the per-entry prefixes once for this directory
+            branch_prefix = prefix + self.tree_symbols["branch"]
+            last_branch_prefix = prefix + self.tree_symbols["last_branch"]
+            last_index = len(filtered_items) - 1
+
             # Process each item
             for i, item in enumerate(filtered_items):
-                is_last = i == len(filtered_items) - 1
-
-                # Choose appropriate symbol
-                if is_last:
-                    symbol = self.tree_symbols["last_branch"]
-                    next_prefix = prefix + self.tree_symbols["space"]
-                else:
-                    symbol = self.tree_symbols["branch"]
-                    next_prefix = prefix + self.tree_symbols["vertical"]
+                is_last = i == last_index
+                line_prefix = last_branch_prefix if is_last else branch_prefix
 
                 # Add item to tree
                 if item.is_dir():
-                    lines.append(f"{prefix}{symbol}{item.name}/")
+                    lines.append(f"{line_prefix}{item.name}/")
+                    next_prefix = (
+                        prefix + self.tree_symbols["space" if is_last else "vertical"]
+                    )
                     # Recursively process subdirectory
                     self._generate_tree_recursive(
                         item, lines, next_prefix, depth + 1, max_depth
                     )
                 else:
-                    lines.append(f"{prefix}{symbol}{item.name}")
+                    lines.append(f"{line_prefix}{item.name}")
 
         except (OSError, PermissionError):
             lines.append(f"{prefix}[Error reading directory]")
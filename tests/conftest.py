@@ -1,13 +1,29 @@
 """Pytest configuration and fixtures."""
 
+import io
 import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
+from rich.console import Console
 
 from folder2md4llms.utils.config import Config
 from folder2md4llms.utils.ignore_patterns import IgnorePatterns
+from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """Keep CLI tests from reaching PyPI or GitHub for upgrades and update checks."""
+    monkeypatch.setattr(
+        "folder2md4llms.cli.handle_upgrade_workflow",
+        MagicMock(return_value=(True, None)),
+    )
+    monkeypatch.setattr(
+        "folder2md4llms.cli.check_for_updates_async_background", MagicMock()
+    )
 
 
 @pytest.fixture
@@ -72,3 +88,21 @@ def sample_docx_content():
 def sample_xlsx_content():
     """Sample XLSX content for testing."""
     return b"PK\x03\x04\x14\x00\x06\x00\x08\x00\x00\x00!"
+
+
+@pytest.fixture(scope="session")
+def silent_console():
+    """Create a Rich console that renders into memory instead of stdout."""
+    return Console(
+        file=io.StringIO(),
+        force_terminal=False,
+        width=80,
+        color_system=None,
+        highlight=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def upgrade_notifier(silent_console):
+    """Create an upgrade notifier backed by the silent console."""
+    return RichUpgradeNotifier(silent_console)
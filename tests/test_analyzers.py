@@ -2,8 +2,10 @@
 
 import json
 import os
+import re
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from folder2md4llms.analyzers.base_code_analyzer import BaseCodeAnalyzer
 from folder2md4llms.analyzers.binary_analyzer import BinaryAnalyzer
@@ -12,7 +14,10 @@ from folder2md4llms.analyzers.config_analyzer import ConfigAnalyzer
 from folder2md4llms.analyzers.java_analyzer import JavaAnalyzer
 from folder2md4llms.analyzers.javascript_analyzer import JavaScriptAnalyzer
 from folder2md4llms.analyzers.priority_analyzer import ContentPriorityAnalyzer
-from folder2md4llms.analyzers.progressive_condenser import ProgressiveCondenser
+from folder2md4llms.analyzers.progressive_condenser import (
+    CondensingLevel,
+    ProgressiveCondenser,
+)
 
 
 class ConcreteCodeAnalyzer(BaseCodeAnalyzer):
@@ -108,6 +113,32 @@ class TestClass:
         assert "# This is a comment" in cleaned
         assert "# Another comment" in cleaned
 
+    def test_finditer_with_lines(self):
+        """Test that matches are paired with their line numbers."""
+        analyzer = ConcreteCodeAnalyzer()
+        content = "def a():\n\n    def b():\n        pass\ndef c(): pass"
+
+        found = [
+            (match.group(1), line)
+            for match, line in analyzer._finditer_with_lines(
+                re.compile(r"def (\w+)"), content
+            )
+        ]
+
+        assert found == [("a", 1), ("b", 3), ("c", 5)]
+
+    def test_preceding_lines(self):
+        """Test looking back a bounded number of lines from a position."""
+        analyzer = ConcreteCodeAnalyzer()
+        content = "one\ntwo\nthree\nfour"
+        end_pos = content.index("four") + 2
+
+        for count in range(1, 6):
+            assert (
+                analyzer._preceding_lines(content, end_pos, count)
+                == content[:end_pos].split("\n")[-count:]
+            )
+
 
 class TestBinaryAnalyzer:
     """Test binary file analyzer."""
@@ -450,6 +481,15 @@ public class HelloWorld {
         finally:
             os.unlink(temp_path)
 
+    def test_find_matching_brace_skips_literals(self):
+        """Test that braces inside strings, chars and escapes are ignored."""
+        analyzer = JavaAnalyzer()
+        content = 'void f() { String s = "}\\"}"; char c = \'{\'; }\nint x;'
+
+        assert analyzer._find_matching_brace(content, 9) == content.index("\n") - 1
+        assert analyzer._find_matching_brace(content, 0) is None
+        assert analyzer._find_matching_brace("{ {", 0) is None
+
     def test_analyze_invalid_java_file(self):
         """Test analyzing an invalid Java file."""
         invalid_java = "public class invalid syntax"
@@ -590,6 +630,30 @@ class TestClass implements User {
         finally:
             os.unlink(temp_path)
 
+    def test_find_matching_brace(self):
+        """Test matching nested braces and unterminated blocks."""
+        analyzer = JavaScriptAnalyzer()
+        content = "class A {\n  m() { if (x) { y(); } }\n}\nz();"
+
+        assert analyzer._find_matching_brace(content, 8) == content.rindex("}")
+        assert analyzer._find_matching_brace(content, 0) is None
+        assert analyzer._find_matching_brace("{ { }", 0) is None
+
+    def test_find_matching_brace_pairs_content_once(self):
+        """Test that every block of the same content is resolved from one scan."""
+        analyzer = JavaScriptAnalyzer()
+        content = "class A { a() {} }\nclass B { b() {} }"
+        opens = [i for i, char in enumerate(content) if char == "{"]
+
+        expected = [analyzer._find_matching_brace(content, pos) for pos in opens]
+        with patch("folder2md4llms.analyzers.base_code_analyzer._BRACE_RE") as brace_re:
+            brace_re.finditer.side_effect = AssertionError("rescanned")
+            cached = [analyzer._find_matching_brace(content, pos) for pos in opens]
+
+        brace_re.finditer.assert_not_called()
+        assert cached == expected
+        assert expected[0] == content.index("}\n") and expected[2] == len(content) - 1
+
     def test_analyze_invalid_javascript_file(self):
         """Test analyzing an invalid JavaScript file."""
         invalid_js = "function invalid syntax here"
@@ -870,4 +934,5 @@ def less_important_function():
         # Test with small content
         result = condenser.adjust_condensing_level(content, "signatures", 10, 1000)
         assert result is not None
-        assert len(result) <= len(content)
+        # Unknown level names fall back to moderate condensing
+        assert result == CondensingLevel.MODERATE
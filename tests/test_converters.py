@@ -1,11 +1,18 @@
 """Comprehensive tests for all document converters."""
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from folder2md4llms.converters.base import BaseConverter, ConversionError
+from folder2md4llms.converters.base import (
+    _NON_ASCII_SPACE_PATTERN,
+    _NON_PRINTABLE_PATTERN,
+    BaseConverter,
+    ConversionError,
+    _count_non_printable,
+)
 from folder2md4llms.converters.code_converter import CodeConverter
 from folder2md4llms.converters.converter_factory import ConverterFactory
 from folder2md4llms.converters.docx_converter import DOCXConverter
@@ -16,6 +23,7 @@ from folder2md4llms.converters.python_converter import PythonConverter
 from folder2md4llms.converters.rtf_converter import RTFConverter
 from folder2md4llms.converters.smart_python_converter import SmartPythonConverter
 from folder2md4llms.converters.xlsx_converter import XLSXConverter
+from folder2md4llms.utils.token_utils import estimate_tokens_from_text
 
 
 class ConcreteConverter(BaseConverter):
@@ -120,6 +128,26 @@ class TestBaseConverter:
         # Non-printable characters should be removed or marked
         assert "\x01" not in result
 
+    def test_count_non_printable_matches_pattern(self):
+        """Test that the fast counting matches the same characters as the regex."""
+        samples = [
+            "plain text\twith\r\nwhitespace\x0b\x0c",
+            "\x01\x02control\x7f\x1b[0m",
+            "mixed \u00e9\u4e2d\x03 text\u2003",
+            "\u65e5\u672c\u8a9e\u3000\xa0\x85\u2028 \ud800",
+            "",
+        ]
+        for sample in samples:
+            assert _count_non_printable(sample) == len(
+                _NON_PRINTABLE_PATTERN.findall(sample)
+            )
+
+        # The non-ASCII whitespace table must cover exactly what \\s matches
+        non_ascii = "".join(chr(c) for c in range(0x80, sys.maxunicode + 1))
+        assert "".join(_NON_ASCII_SPACE_PATTERN.findall(non_ascii)) == "".join(
+            c for c in non_ascii if c.isspace()
+        )
+
     def test_get_file_info_success(self):
         """Test getting file info for existing file."""
         with tempfile.NamedTemporaryFile(delete=False) as f:
@@ -939,6 +967,43 @@ class SmartClass:
         assert test_path in converter.budget_allocations
         assert converter.budget_allocations[test_path] == mock_allocation
 
+    def test_analyze_function_priorities(self):
+        """Test that every top-level and nested function gets a priority."""
+        converter = SmartPythonConverter({"smart_condensing": True})
+        python_code = """
+def main():
+    return helper()
+
+class Service:
+    def helper(self):
+        return 42
+"""
+        priorities = converter.analyze_function_priorities(python_code)
+
+        assert set(priorities) == {"main", "helper"}
+
+    def test_convert_with_priority_analysis_counts_tokens_once(self):
+        """Test the converter reuses the condenser's token counts."""
+        converter = SmartPythonConverter({"smart_condensing": True})
+        python_code = "def main():\n    return 42\n" * 20
+
+        with patch(
+            "folder2md4llms.converters.smart_python_converter.estimate_tokens_from_text",
+            wraps=estimate_tokens_from_text,
+        ) as mock_estimate:
+            _, analysis_info = converter.convert_with_priority_analysis(
+                Path("main.py"), python_code, 10
+            )
+
+        mock_estimate.assert_called_once_with(python_code)
+        assert analysis_info["original_tokens"] == estimate_tokens_from_text(
+            python_code
+        )
+        assert (
+            analysis_info["final_tokens"]
+            == analysis_info["condensing_info"]["final_tokens"]
+        )
+
     def test_convert_nonexistent_file(self):
         """Test conversion of non-existent file."""
         converter = SmartPythonConverter({})
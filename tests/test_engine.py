@@ -212,6 +212,15 @@ function helloWorld() {
         ]
         assert token_estimates[nonexistent_file] == 0
 
+    def test_analyze_repository_clears_ast_cache(self):
+        """Test that each repository run starts with an empty AST cache."""
+        engine = SmartAntiTruncationEngine(total_token_limit=1000)
+        engine.progressive_condenser._parse_python("x = 1\n")
+
+        engine.analyze_repository([], Path.cwd())
+
+        assert engine.progressive_condenser._ast_cache == {}
+
     def test_analyze_repository_binary_file(self):
         """Test analyzing repository with binary file."""
         with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
@@ -320,6 +329,22 @@ def test_function():
         assert processing_info["method"] == "unchanged"
         assert processing_info["reason"] == "fits_in_budget"
 
+    def test_process_file_with_budget_counts_tokens_once(self):
+        """Test that content without an allocation is only tokenized once."""
+        engine = SmartAntiTruncationEngine(total_token_limit=1000)
+        content = "def small_function():\n    pass"
+
+        with patch.object(
+            engine, "_count_tokens", wraps=engine._count_tokens
+        ) as count_tokens:
+            processed_content, processing_info = engine.process_file_with_budget(
+                Path("test.py"), content
+            )
+
+        assert processed_content == content
+        assert processing_info["reason"] == "fits_in_budget"
+        count_tokens.assert_called_once_with(content)
+
     def test_process_file_with_budget_progressive_condensing(self):
         """Test processing file with progressive condensing."""
         engine = SmartAntiTruncationEngine(total_token_limit=1000)
@@ -447,6 +472,50 @@ def another_function():
         # Should use fallback minimum
         assert processing_info["available_tokens"] == 100
 
+    def test_process_files_with_budget_matches_per_file(self):
+        """Test that batch processing matches per-file processing."""
+        content = "\n".join(
+            f"def function_{i}(x):\n    return x + {i}" for i in range(40)
+        )
+        files = [
+            (
+                Path("a.py"),
+                content,
+                {"allocated_tokens": 30, "priority": PriorityLevel.LOW},
+            ),
+            (Path("b.py"), "def small():\n    pass", None),
+            (Path("c.py"), "", None),
+            (
+                Path("d.py"),
+                content,
+                {"allocated_tokens": 60, "priority": PriorityLevel.HIGH},
+            ),
+        ]
+
+        sequential_engine = SmartAntiTruncationEngine(
+            total_token_limit=1000, token_counting_method="average"
+        )
+        expected = [sequential_engine.process_file_with_budget(*file) for file in files]
+
+        engine = SmartAntiTruncationEngine(
+            total_token_limit=1000, token_counting_method="average"
+        )
+        with patch.object(
+            engine.progressive_condenser,
+            "condense_batch",
+            wraps=engine.progressive_condenser.condense_batch,
+        ) as condense_batch:
+            results = engine.process_files_with_budget(files, max_workers=2)
+
+        assert results == expected
+        batch = condense_batch.call_args.args[0]
+        assert [item[1] for item in batch] == [Path("a.py"), Path("d.py")]
+        assert engine.stats["progressive_condensing_applied"] == 2
+        assert (
+            engine.stats["total_tokens_saved"]
+            == sequential_engine.stats["total_tokens_saved"]
+        )
+
     def test_intelligent_truncate_with_comments(self):
         """Test intelligent truncation with various comment types."""
         engine = SmartAntiTruncationEngine(total_token_limit=1000)
@@ -1,6 +1,10 @@
 """Tests for file utility functions."""
 
+from pathlib import Path
+
 from folder2md4llms.utils.file_utils import (
+    _is_binary_file_fallback,
+    bulk_stat,
     find_folder2md_output_files,
     get_file_category,
     get_file_stats,
@@ -12,6 +16,7 @@ from folder2md4llms.utils.file_utils import (
     is_image_file,
     is_text_file,
     read_file_safely,
+    should_condense_code_file,
     should_convert_file,
 )
 
@@ -32,6 +37,16 @@ class TestFileUtils:
         assert not is_binary_file(text_file)
         assert is_binary_file(binary_file)
 
+    def test_is_binary_file_fallback_printable_ratio(self, temp_dir):
+        """Test the fallback flags files under 95% printable bytes."""
+        text_file = temp_dir / "notes.txt"
+        text_file.write_bytes(b"line one\tcolumn\r\n" * 100)
+        noisy_file = temp_dir / "noisy.dat"
+        noisy_file.write_bytes(b"a" * 90 + bytes(range(1, 9)) + b"\x80\xff")
+
+        assert not _is_binary_file_fallback(text_file)
+        assert _is_binary_file_fallback(noisy_file)
+
     def test_is_text_file(self, temp_dir):
         """Test text file detection."""
         # Create text file
@@ -59,6 +74,20 @@ class TestFileUtils:
         assert "modified" in stats
         assert "created" in stats
 
+    def test_bulk_stat(self, temp_dir):
+        """Test stat'ing many files serially and with a thread pool."""
+        paths = []
+        for i in range(5):
+            path = temp_dir / f"file_{i}.txt"
+            path.write_text("x" * i)
+            paths.append(path)
+        missing = temp_dir / "missing.txt"
+
+        for workers in (1, 4):
+            stats = bulk_stat([*paths, missing], workers=workers)
+            assert missing not in stats
+            assert [stats[path].st_size for path in paths] == [0, 1, 2, 3, 4]
+
     def test_should_convert_file(self, temp_dir):
         """Test document conversion detection."""
         pdf_file = temp_dir / "document.pdf"
@@ -126,6 +155,20 @@ class TestFileUtils:
         assert get_language_from_extension(".unknown") is None
         assert get_language_from_extension(".PY") == "python"  # case insensitive
 
+    def test_should_condense_code_file(self):
+        """Test code condensing eligibility by configured languages."""
+        languages = ["js", "yaml", ".kt"]
+        assert should_condense_code_file(Path("app.JSX"), True, languages)
+        assert should_condense_code_file(Path("config.yml"), True, languages)
+        assert should_condense_code_file(Path("Main.kt"), True, languages)
+        assert not should_condense_code_file(Path("Main.java"), True, languages)
+        assert not should_condense_code_file(Path("app.js"), False, languages)
+        assert not should_condense_code_file(Path("app.js"), True, [])
+
+        assert should_condense_code_file(Path("setup.cfg"), True, ["all"])
+        assert should_condense_code_file(Path("setup.cfg"), True, "all")
+        assert not should_condense_code_file(Path("main.py"), True, ["all"])
+
     def test_is_image_file(self, temp_dir):
         """Test image file detection."""
         jpg_file = temp_dir / "image.jpg"
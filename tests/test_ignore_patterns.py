@@ -1,5 +1,7 @@
 """Tests for ignore patterns functionality."""
 
+from unittest.mock import patch
+
 from folder2md4llms.utils.ignore_patterns import IgnorePatterns
 
 
@@ -51,6 +53,34 @@ class TestIgnorePatterns:
 
         assert patterns.should_ignore(pycache_dir, temp_dir)
 
+    def test_should_ignore_uses_directory_hint(self, temp_dir):
+        """Test that a caller-supplied directory flag skips the filesystem check."""
+        patterns = IgnorePatterns()
+
+        # Neither path exists, so only the hint can mark them as directories
+        assert patterns.should_ignore(temp_dir / "build", temp_dir, is_directory=True)
+        assert not patterns.should_ignore(
+            temp_dir / "build", temp_dir, is_directory=False
+        )
+
+    def test_walk_prunes_ignored_directories(self, temp_dir):
+        """Test that walking never descends into ignored directories."""
+        patterns = IgnorePatterns()
+
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "module.py").touch()
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "node_modules" / "pkg" / "index.js").touch()
+
+        walked = {
+            directory.relative_to(temp_dir).as_posix(): (dirnames, filenames)
+            for directory, dirnames, filenames in patterns.walk(temp_dir)
+        }
+
+        assert set(walked) == {".", "src"}
+        assert walked["."][0] == ["src"]
+        assert walked["src"][1] == ["module.py"]
+
     def test_should_ignore_nested_pycache(self, temp_dir):
         """Test ignoring nested __pycache__ directory."""
         patterns = IgnorePatterns()
@@ -132,6 +162,53 @@ class TestIgnorePatterns:
         assert patterns.should_ignore(temp_dir / "test_file.py", temp_dir)
         assert not patterns.should_ignore(temp_dir / "normal.py", temp_dir)
 
+    def test_combined_regex_matches_pattern_loop(self, temp_dir):
+        """Test the combined regex agrees with matching pattern by pattern."""
+        patterns = IgnorePatterns(
+            [*IgnorePatterns.DEFAULT_PATTERNS, "docs/*.md", "!keep.log", "[ab]?.tmp"]
+        )
+        paths = [
+            "keep.log",
+            "debug.log",
+            "docs/readme.md",
+            "docs/api/readme.md",
+            "src/a1.tmp",
+            "src/c1.tmp",
+            "src/__pycache__/mod.pyc",
+            "node_modules",
+            "src/main.py",
+        ]
+
+        for path in paths:
+            for is_directory in (True, False):
+                combined = patterns.should_ignore(
+                    temp_dir / path, temp_dir, is_directory=is_directory
+                )
+                expected = False
+                entries = (
+                    patterns.parsed_patterns
+                    if is_directory
+                    else patterns._file_patterns
+                )
+                for pattern, is_negated, _ in entries:
+                    if patterns._matches_gitignore_pattern(path, pattern, is_directory):
+                        expected = not is_negated
+                assert combined == expected, (path, is_directory)
+
+    def test_should_ignore_caches_results(self, temp_dir):
+        """Test repeated lookups are memoized until the patterns change."""
+        patterns = IgnorePatterns(["*.log"])
+        path = temp_dir / "src" / "main.py"
+
+        assert not patterns.should_ignore(path, temp_dir, is_directory=False)
+        with patch.object(
+            patterns, "_match_path", side_effect=AssertionError("not cached")
+        ):
+            assert not patterns.should_ignore(path, temp_dir, is_directory=False)
+
+        patterns.add_pattern("*.py")
+        assert patterns.should_ignore(path, temp_dir, is_directory=False)
+
     def test_directory_patterns(self, temp_dir):
         """Test directory-specific patterns."""
         patterns = IgnorePatterns(["build/*", "dist/**/*"])
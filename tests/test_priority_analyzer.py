@@ -2,11 +2,13 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from folder2md4llms.analyzers.priority_analyzer import (
     ContentPriorityAnalyzer,
     PriorityLevel,
 )
+from folder2md4llms.utils.ignore_patterns import IgnorePatterns
 
 
 class TestContentPriorityAnalyzer:
@@ -51,6 +53,15 @@ class TestContentPriorityAnalyzer:
             framework = self.analyzer.detect_framework(Path(tmpdir))
             assert framework == "nextjs"
 
+    def test_framework_detection_skips_ignored_directories(self):
+        """Test that indicators inside dependency directories are not used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            vendored = Path(tmpdir, "node_modules", "some-package")
+            vendored.mkdir(parents=True)
+            Path(vendored, "manage.py").touch()
+            framework = self.analyzer.detect_framework(Path(tmpdir))
+            assert framework is None
+
     def test_critical_file_patterns(self):
         """Test that critical file patterns are detected correctly."""
         critical_files = [
@@ -145,6 +156,38 @@ SECRET_KEY = settings.SECRET_KEY
             assert utils_path in import_scores
             assert import_scores[utils_path] > 0
 
+    def test_import_frequency_uses_injected_ignore_patterns(self):
+        """Test that repository walks honour the patterns passed in."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            (repo_path / "generated").mkdir()
+            (repo_path / "utils.py").write_text("def helper(): pass")
+            (repo_path / "generated" / "client.py").write_text(
+                "from utils import helper"
+            )
+            (repo_path / "scratch.py").write_text("from utils import helper")
+
+            analyzer = ContentPriorityAnalyzer(
+                IgnorePatterns(["generated/", "scratch.py"])
+            )
+            import_scores = analyzer.analyze_import_frequency(repo_path)
+
+            assert repo_path / "utils.py" not in import_scores
+
+    def test_start_run_clears_framework_cache(self):
+        """Test that a new run re-detects frameworks after the tree changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            assert self.analyzer.detect_framework(repo_path) is None
+
+            (repo_path / "manage.py").touch()
+            assert self.analyzer.detect_framework(repo_path) is None
+
+            patterns = IgnorePatterns(["*.log"])
+            self.analyzer.start_run(patterns)
+            assert self.analyzer.ignore_patterns is patterns
+            assert self.analyzer.detect_framework(repo_path) == "django"
+
     def test_javascript_content_analysis(self):
         """Test JavaScript/TypeScript content analysis."""
         # Test Express.js route detection
@@ -249,6 +292,23 @@ class AnotherClass:
         )
         assert complexity > 0.3  # Should be higher for complex code
 
+    def test_definition_free_python_skips_parsing(self):
+        """Test that source without def or class is never parsed."""
+        data_content = "VALUES = [\n" + "    1,\n" * 200 + "]\n"
+
+        with patch(
+            "folder2md4llms.analyzers.priority_analyzer.ast.parse",
+            side_effect=AssertionError("parsed"),
+        ):
+            assert (
+                self.analyzer._analyze_python_content(data_content)
+                == PriorityLevel.MEDIUM
+            )
+            assert (
+                self.analyzer.analyze_code_complexity(data_content, Path("data.py"))
+                == 0.0
+            )
+
     def test_framework_pattern_application(self):
         """Test that framework-specific patterns are applied correctly."""
         # Test Django patterns
@@ -1,10 +1,13 @@
 """Tests for the main repository processor."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from folder2md4llms.processor import RepositoryProcessor
+from folder2md4llms.analyzers.priority_analyzer import PriorityLevel
+from folder2md4llms.processor import RepositoryProcessor, _allocation_as_dict
+from folder2md4llms.utils.smart_budget_manager import BudgetAllocation
 from folder2md4llms.utils.token_utils import is_tiktoken_available
 
 
@@ -212,6 +215,25 @@ class TestRepositoryProcessor:
         assert processor.smart_engine is not None
         assert processor.smart_python_converter is not None
 
+    def test_smart_condensing_falls_back_per_file(self, sample_repo, config):
+        """Test that a failing batch still processes text files one by one."""
+        config.smart_condensing = True
+        config.token_limit = 1000
+        config.condense_python = False
+
+        processor = RepositoryProcessor(config)
+        assert processor.smart_engine is not None
+        with patch.object(
+            processor.smart_engine,
+            "process_files_with_budget",
+            side_effect=RuntimeError("pool failed"),
+        ) as process_files:
+            result = processor.process(sample_repo)
+
+        process_files.assert_called_once()
+        assert "main.py" in result
+        assert "print('Hello, World!')" in result
+
     def test_process_with_budget_strategy(self, sample_repo, config):
         """Test processing with different budget strategies."""
         config.smart_condensing = True
@@ -641,3 +663,22 @@ class TestRepositoryProcessor:
         assert processor.markdown_formatter.token_limit == 5000
         assert processor.markdown_formatter.char_limit == 20000
         assert processor.markdown_formatter.token_estimation_method == "optimistic"
+
+    def test_allocation_as_dict_reads_slotted_allocations(self):
+        """Test budget allocations reach the engine despite having no __dict__."""
+        allocation = BudgetAllocation(
+            file_path=Path("main.py"),
+            priority=PriorityLevel.HIGH,
+            allocated_tokens=120,
+            estimated_content_tokens=300,
+            condensing_level="moderate",
+        )
+
+        allocation_dict = _allocation_as_dict(allocation)
+
+        assert not hasattr(allocation, "__dict__")
+        assert allocation_dict is not None
+        assert allocation_dict["allocated_tokens"] == 120
+        assert allocation_dict["priority"] is PriorityLevel.HIGH
+        assert _allocation_as_dict({"allocated_tokens": 5}) == {"allocated_tokens": 5}
+        assert _allocation_as_dict(None) is None
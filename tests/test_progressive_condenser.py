@@ -1,12 +1,20 @@
 """Tests for the progressive condenser functionality."""
 
+import ast
+import pickle
 from pathlib import Path
+from unittest.mock import patch
 
 from folder2md4llms.analyzers.priority_analyzer import PriorityLevel
 from folder2md4llms.analyzers.progressive_condenser import (
     CondensingLevel,
     ProgressiveCondenser,
     PythonCodeAnalyzer,
+    _scan_js_declarations,
+)
+
+_ESTIMATE_TOKENS = (
+    "folder2md4llms.analyzers.progressive_condenser.estimate_tokens_from_text"
 )
 
 
@@ -217,6 +225,54 @@ def another_public(data):
         # Should not preserve private functions
         assert "_private_function" not in result
 
+    def test_function_signature_with_annotation_colons(self):
+        """Test that multi-line signatures with annotated colons are kept whole."""
+        content = """
+def typed_function(
+    mapping: dict[str, int],
+    default: str = "a:b",
+) -> None:
+    # Comment before the body
+    return None
+"""
+        import ast
+
+        lines = content.split("\n")
+        node = ast.parse(content).body[0]
+        signature = self.condenser._get_function_signature(node, lines)
+
+        assert signature == "\n".join(lines[1:5])
+
+    def test_function_signature_excludes_nested_decorators(self):
+        """Test that a decorated first body statement stays out of the signature."""
+        content = """def top(a,
+        b):
+    @cache
+    def helper():
+        return a
+    return helper
+"""
+        import ast
+
+        lines = content.split("\n")
+        node = ast.parse(content).body[0]
+        signature = self.condenser._get_function_signature(node, lines)
+
+        assert signature == "def top(a,\n        b):"
+
+    def test_function_signature_with_body_on_closing_line(self):
+        """Test that a body sharing the last signature line keeps the whole header."""
+        content = """def f(a,
+      b): return a
+"""
+        import ast
+
+        lines = content.split("\n")
+        node = ast.parse(content).body[0]
+        signature = self.condenser._get_function_signature(node, lines)
+
+        assert signature == "def f(a,\n      b): return a"
+
     def test_extract_python_public_api(self):
         """Test Python public API extraction."""
         content = """
@@ -268,6 +324,24 @@ function privateFunction() {
         assert "export const API_KEY" in result
         assert "export default class App" in result
 
+    def test_scan_js_declarations_single_pass(self):
+        """Test the single-pass JS scan finds the same declarations as findall."""
+        content = """
+export default class App extends Component {}
+export async function loadData(url) {}
+function helper(a, b) {}
+const value = 1;
+class Widget {}
+"""
+        exports, functions, classes = _scan_js_declarations(content)
+
+        assert exports == ["export default class App"]
+        assert functions == [
+            "export async function loadData(url)",
+            "function helper(a, b)",
+        ]
+        assert classes == ["class App extends Component", "class Widget"]
+
     def test_extract_java_public_api(self):
         """Test Java public API extraction."""
         content = """
@@ -379,6 +453,69 @@ def important_function(arg1, arg2):
         )
         assert new_level == CondensingLevel.LIGHT
 
+        # Adjustments saturate at both ends of the scale
+        assert (
+            self.condenser._increase_condensing_level(CondensingLevel.MAXIMUM)
+            == CondensingLevel.MAXIMUM
+        )
+        assert (
+            self.condenser._decrease_condensing_level(CondensingLevel.NONE)
+            == CondensingLevel.NONE
+        )
+        assert str(CondensingLevel.HEAVY) == "heavy"
+
+    def test_generic_light_condensing(self):
+        """Test that light generic condensing drops blank and comment lines."""
+        content = "# header\n\nfirst line\n   \n  # indented comment\nsecond line\n"
+
+        result = self.condenser._condense_generic_content(
+            content, CondensingLevel.LIGHT
+        )
+
+        assert result == "first line\nsecond line"
+
+    def test_ast_parse_is_cached_across_passes(self):
+        """Test that the same source is parsed only once per condenser."""
+        content = (
+            "import os\n\n\n"
+            "def cached(a, b):\n"
+            '    """Add two values."""\n'
+            "    total = a + b\n"
+            "    return total\n"
+        )
+
+        with patch(
+            "folder2md4llms.analyzers.progressive_condenser.ast.parse",
+            wraps=ast.parse,
+        ) as mock_parse:
+            for _ in range(2):
+                self.condenser.condense_with_budget(
+                    content, Path("cached.py"), 1, PriorityLevel.LOW
+                )
+            mock_parse.assert_called_once()
+
+            self.condenser.clear_ast_cache()
+            self.condenser.condense_with_budget(
+                content, Path("cached.py"), 1, PriorityLevel.LOW
+            )
+
+        assert mock_parse.call_count == 2
+
+    def test_unchanged_content_is_not_re_estimated(self):
+        """Test that content left as-is reuses its original token count."""
+        content = "def untouched(value):\n    return value\n"
+
+        with patch(_ESTIMATE_TOKENS) as mock_estimate:
+            result, info = self.condenser.condense_with_budget(
+                content, Path("untouched.py"), 1000, PriorityLevel.MEDIUM, 12
+            )
+
+        assert result is content
+        assert info["level"] == CondensingLevel.NONE
+        assert info["final_tokens"] == 12
+        assert info["tokens_saved"] == 0
+        mock_estimate.assert_not_called()
+
     def test_generate_smart_statistics(self):
         """Test smart statistics generation."""
         processing_results = {
@@ -424,6 +561,54 @@ def important_function(arg1, arg2):
         assert "condensing_levels_used" in stats
         assert stats["tokens_saved"] >= 0
 
+    def test_condense_batch_matches_sequential(self):
+        """Test that batch condensing matches per-file condensing and merges stats."""
+        content = "\n".join(
+            f"def function_{i}(x):\n    return x + {i}" for i in range(20)
+        )
+        items = [
+            (content, Path("a.py"), 20, PriorityLevel.LOW),
+            (content, Path("b.py"), 100, PriorityLevel.HIGH),
+            ("", Path("empty.py"), 100, PriorityLevel.MEDIUM),
+        ]
+
+        expected = [
+            ProgressiveCondenser().condense_with_budget(*item) for item in items
+        ]
+        with patch(
+            "folder2md4llms.analyzers.progressive_condenser._MIN_PARALLEL_ITEMS", 2
+        ):
+            results = self.condenser.condense_batch(items, max_workers=2)
+
+        assert results == expected
+        stats = self.condenser.get_condensing_stats()
+        assert stats["files_processed"] == 2
+        assert stats["tokens_saved"] == sum(
+            info["tokens_saved"] for _, info in expected
+        )
+
+    def test_pickled_condenser_drops_ast_cache(self):
+        """Test that worker copies of a condenser do not carry parsed trees."""
+        self.condenser._parse_python("x = 1\n")
+
+        copy = pickle.loads(pickle.dumps(self.condenser))
+
+        assert self.condenser._ast_cache
+        assert copy._ast_cache == {}
+        assert copy.stats == self.condenser.stats
+
+    def test_short_function_skips_token_estimation(self):
+        """Test that content shorter than the budget is returned untokenized."""
+        function_content = "def short_function(y):\n    return y + 1\n"
+
+        with patch(_ESTIMATE_TOKENS) as mock_estimate:
+            result = self.condenser.condense_function_selectively(
+                function_content, PriorityLevel.LOW, len(function_content)
+            )
+
+        assert result == function_content
+        mock_estimate.assert_not_called()
+
     def test_edge_cases(self):
         """Test edge cases and error handling."""
         # Test with empty content
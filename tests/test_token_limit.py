@@ -191,3 +191,16 @@ class TestTokenLimitFunctionality:
 
         # Should show 0% condensed
         assert "75,000/75,000 tokens (0.0% condensed)" in preamble
+
+    def test_format_repository_output_has_no_surrogates(self):
+        """Test that surrogates in paths and content are cleaned from the output."""
+        from folder2md4llms.formatters.markdown import MarkdownFormatter
+
+        formatter = MarkdownFormatter(token_limit=1000)
+        output = formatter.format_repository(
+            Path("/test/repo"),
+            file_contents={"bad\udcffname.py": "x = '\ud800'\n" * 500},
+        )
+
+        output.encode("utf-8")
+        assert "[Content truncated at" in output
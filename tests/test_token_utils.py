@@ -22,6 +22,7 @@ from folder2md4llms.utils.token_utils import (
     get_token_counting_method_info,
     is_tiktoken_available,
     stream_file_content,
+    token_count_upper_bound,
 )
 
 
@@ -285,6 +286,20 @@ class TestEstimateTokensFromText:
         assert isinstance(tokens, int)
         assert tokens > 0
 
+    def test_token_count_upper_bound(self):
+        """Test the cheap bound is never below any estimation method."""
+        samples = [
+            "",
+            "Hello world",
+            "def f():\n    return {}\n" * 50,
+            "\U0001f600\u4e2d\u6587 mixed text",
+        ]
+        for text in samples:
+            for method in [*CHAR_TO_TOKEN_RATIO, "tiktoken"]:
+                assert estimate_tokens_from_text(
+                    text, method=method
+                ) <= token_count_upper_bound(text)
+
 
 class TestEstimateTokensFromFile:
     """Test token estimation from files."""
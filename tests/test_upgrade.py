@@ -1,202 +1,161 @@
 """Tests for upgrade workflow integration."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import create_autospec
 
 import pytest
-from click.testing import CliRunner
+from henriqueslab_updater import UpgradeNotifier, handle_upgrade_workflow
 
 from folder2md4llms.cli import main
 
 
-class TestUpgradeCommand:
-    """Test upgrade CLI command integration."""
-
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_check_flag(self, mock_workflow):
-        """Test --upgrade-check flag invokes workflow correctly."""
-        mock_workflow.return_value = (True, None)  # No update available
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade-check"])
-
-        assert result.exit_code == 0
-        mock_workflow.assert_called_once()
-        call_kwargs = mock_workflow.call_args.kwargs
-        assert call_kwargs["package_name"] == "folder2md4llms"
-        assert call_kwargs["check_only"] is True
-        assert call_kwargs["skip_confirmation"] is False
-        assert call_kwargs["github_org"] == "henriqueslab"
-        assert call_kwargs["github_repo"] == "folder2md4llms"
-
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_check_with_update_available(self, mock_workflow):
-        """Test --upgrade-check when update is available."""
-        mock_workflow.return_value = (False, None)  # Update available in check-only mode
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade-check"])
-
-        assert result.exit_code == 0  # Should still exit 0 in check-only mode
-        mock_workflow.assert_called_once()
-
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_flag(self, mock_workflow):
-        """Test --upgrade flag invokes workflow correctly."""
-        mock_workflow.return_value = (True, None)  # Successful upgrade
+def _run_main(args):
+    """Run the CLI in-process and return the exit code it finishes with."""
+    with pytest.raises(SystemExit) as exc_info:
+        main.main(args, prog_name="folder2md")
+    return exc_info.value.code
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade"])
 
-        assert result.exit_code == 0
-        mock_workflow.assert_called_once()
-        call_kwargs = mock_workflow.call_args.kwargs
-        assert call_kwargs["package_name"] == "folder2md4llms"
-        assert call_kwargs["check_only"] is False
-        assert call_kwargs["skip_confirmation"] is False
+@pytest.fixture(scope="class")
+def workflow_spec_mock():
+    """Autospec the upgrade workflow once per class to check call signatures."""
+    return create_autospec(handle_upgrade_workflow)
 
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_with_yes_flag(self, mock_workflow):
-        """Test --upgrade --yes skips confirmation."""
-        mock_workflow.return_value = (True, None)
 
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade", "--yes"])
+class TestUpgradeCommand:
+    """Test upgrade CLI command integration."""
 
-        assert result.exit_code == 0
+    @pytest.fixture(autouse=True)
+    def mock_workflow(self, monkeypatch, workflow_spec_mock):
+        """Install the autospecced workflow mock with a successful default."""
+        workflow_spec_mock.return_value = (True, None)
+        monkeypatch.setattr(
+            "folder2md4llms.cli.handle_upgrade_workflow", workflow_spec_mock
+        )
+        yield workflow_spec_mock
+        workflow_spec_mock.reset_mock()
+
+    @pytest.mark.parametrize(
+        ("argv", "workflow_return", "expected_exit", "expected_kwargs"),
+        [
+            pytest.param(
+                ["--upgrade-check"],
+                (True, None),
+                0,
+                {
+                    "package_name": "folder2md4llms",
+                    "check_only": True,
+                    "skip_confirmation": False,
+                    "github_org": "henriqueslab",
+                    "github_repo": "folder2md4llms",
+                },
+                id="check",
+            ),
+            # Check-only mode still exits 0 when an update is available
+            pytest.param(
+                ["--upgrade-check"], (False, None), 0, {}, id="check-update-available"
+            ),
+            pytest.param(
+                ["--upgrade"],
+                (True, None),
+                0,
+                {
+                    "package_name": "folder2md4llms",
+                    "check_only": False,
+                    "skip_confirmation": False,
+                },
+                id="upgrade",
+            ),
+            pytest.param(
+                ["--upgrade", "--yes"],
+                (True, None),
+                0,
+                {"skip_confirmation": True},
+                id="upgrade-yes",
+            ),
+            pytest.param(
+                ["--upgrade"],
+                (False, "Upgrade failed: network error"),
+                1,
+                {},
+                id="failure",
+            ),
+            # User cancellation still exits with code 1 (from sys.exit(1))
+            pytest.param(
+                ["--upgrade"], (False, "User cancelled"), 1, {}, id="user-cancelled"
+            ),
+        ],
+    )
+    def test_cli_upgrade(
+        self, mock_workflow, argv, workflow_return, expected_exit, expected_kwargs
+    ):
+        """Test the upgrade flags pass the right options and exit codes."""
+        mock_workflow.return_value = workflow_return
+
+        exit_code = _run_main(argv)
+
+        assert exit_code == expected_exit
         mock_workflow.assert_called_once()
         call_kwargs = mock_workflow.call_args.kwargs
-        assert call_kwargs["skip_confirmation"] is True
-
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_failure(self, mock_workflow):
-        """Test upgrade failure exits with code 1."""
-        mock_workflow.return_value = (False, "Upgrade failed: network error")
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade"])
-
-        assert result.exit_code == 1
-        mock_workflow.assert_called_once()
-
-    @patch("folder2md4llms.cli.handle_upgrade_workflow")
-    def test_upgrade_user_cancelled(self, mock_workflow):
-        """Test upgrade when user cancels doesn't exit with error."""
-        mock_workflow.return_value = (False, "User cancelled")
-
-        runner = CliRunner()
-        result = runner.invoke(main, ["--upgrade"])
-
-        # User cancellation should still exit with code 1 (from sys.exit(1))
-        assert result.exit_code == 1
+        for key, value in expected_kwargs.items():
+            # Compare types too so a truthy non-bool can't pass for True
+            assert type(call_kwargs[key]) is type(value), key
+            assert call_kwargs[key] == value, key
 
 
 class TestRichUpgradeNotifier:
     """Test RichUpgradeNotifier adapter."""
 
-    def test_rich_notifier_implements_protocol(self):
+    def test_rich_notifier_implements_protocol(self, upgrade_notifier):
         """Test that RichUpgradeNotifier implements all required methods."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
-        # Check that all protocol methods exist
-        assert hasattr(notifier, "show_checking")
-        assert hasattr(notifier, "show_version_check")
-        assert hasattr(notifier, "show_update_info")
-        assert hasattr(notifier, "show_installer_info")
-        assert hasattr(notifier, "show_success")
-        assert hasattr(notifier, "show_error")
-        assert hasattr(notifier, "show_manual_instructions")
-        assert hasattr(notifier, "confirm_upgrade")
-
-        # Check that methods are callable
-        assert callable(notifier.show_checking)
-        assert callable(notifier.show_version_check)
-        assert callable(notifier.show_update_info)
-        assert callable(notifier.show_installer_info)
-        assert callable(notifier.show_success)
-        assert callable(notifier.show_error)
-        assert callable(notifier.show_manual_instructions)
-        assert callable(notifier.confirm_upgrade)
-
-    def test_rich_notifier_show_checking(self):
-        """Test show_checking displays message."""
-        from rich.console import Console
+        # UpgradeNotifier is not runtime-checkable, so walk its members instead
+        protocol_methods = [
+            name for name in vars(UpgradeNotifier) if not name.startswith("_")
+        ]
 
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
+        assert "confirm_upgrade" in protocol_methods
+        for name in protocol_methods:
+            assert callable(getattr(upgrade_notifier, name, None)), name
 
+    def test_rich_notifier_show_checking(self, upgrade_notifier):
+        """Test show_checking displays message."""
         # Should not raise any errors
-        notifier.show_checking()
+        upgrade_notifier.show_checking()
 
-    def test_rich_notifier_show_version_check_no_update(self):
+    def test_rich_notifier_show_version_check_no_update(self, upgrade_notifier):
         """Test show_version_check when no update available."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
         # Should not raise any errors
-        notifier.show_version_check("1.0.0", "1.0.0", False)
+        upgrade_notifier.show_version_check("1.0.0", "1.0.0", False)
 
-    def test_rich_notifier_show_version_check_update_available(self):
+    def test_rich_notifier_show_version_check_update_available(self, upgrade_notifier):
         """Test show_version_check when update is available."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
         # Should not raise any errors
-        notifier.show_version_check("1.0.0", "1.1.0", True)
-
-    @patch("click.confirm", return_value=True)
-    def test_rich_notifier_confirm_upgrade_yes(self, mock_confirm):
-        """Test confirm_upgrade returns True when user confirms."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
-        result = notifier.confirm_upgrade("1.1.0")
-
-        assert result is True
-        mock_confirm.assert_called_once()
-
-    @patch("click.confirm", return_value=False)
-    def test_rich_notifier_confirm_upgrade_no(self, mock_confirm):
-        """Test confirm_upgrade returns False when user declines."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
-        result = notifier.confirm_upgrade("1.1.0")
-
-        assert result is False
-
-    @patch("click.confirm", side_effect=KeyboardInterrupt)
-    def test_rich_notifier_confirm_upgrade_keyboard_interrupt(self, mock_confirm):
-        """Test confirm_upgrade handles KeyboardInterrupt gracefully."""
-        from rich.console import Console
-
-        from folder2md4llms.utils.rich_upgrade_notifier import RichUpgradeNotifier
-
-        console = Console()
-        notifier = RichUpgradeNotifier(console)
-
-        result = notifier.confirm_upgrade("1.1.0")
-
-        assert result is False
+        upgrade_notifier.show_version_check("1.0.0", "1.1.0", True)
+
+    @pytest.mark.parametrize(
+        ("answer", "expected"),
+        [
+            pytest.param(True, True, id="yes"),
+            pytest.param(False, False, id="no"),
+            # KeyboardInterrupt is handled gracefully as a decline
+            pytest.param(KeyboardInterrupt, False, id="keyboard-interrupt"),
+        ],
+    )
+    def test_rich_notifier_confirm_upgrade(
+        self, upgrade_notifier, monkeypatch, answer, expected
+    ):
+        """Test confirm_upgrade returns the user's answer."""
+        prompts = []
+
+        def fake_confirm(text, **kwargs):
+            prompts.append(text)
+            if answer is KeyboardInterrupt:
+                raise KeyboardInterrupt
+            return answer
+
+        monkeypatch.setattr("click.confirm", fake_confirm)
+
+        result = upgrade_notifier.confirm_upgrade("1.1.0")
+
+        assert result is expected
+        assert len(prompts) == 1
+        assert "v1.1.0" in prompts[0]